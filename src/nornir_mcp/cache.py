@@ -0,0 +1,125 @@
+"""Request coalescing for read-only Nornir MCP tools.
+
+This module deduplicates identical read-only tool calls. Concurrent callers
+with the same key share a single in-flight execution, and successful
+responses are kept for a short TTL so that repeated polling does not open
+new device sessions.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from .constants import DefaultValue, EnvVar
+
+# Seconds a successful response is reused; 0 disables the response cache
+_RESPONSE_TTL = float(os.getenv(EnvVar.CACHE_TTL, DefaultValue.CACHE_TTL))
+
+# Executions currently running, keyed by request key
+_INFLIGHT: dict[Hashable, asyncio.Task] = {}
+# Completed responses as (expiry timestamp, response), keyed by request key
+_RESPONSES: dict[Hashable, tuple[float, dict[str, Any]]] = {}
+
+
+def cached_response(key: Hashable) -> dict[str, Any] | None:
+    """Return a still-valid cached response without scheduling any work.
+
+    Args:
+        key: Hashable identifier of the request
+
+    Returns:
+        The cached response, or None if there is none or it has expired
+
+    """
+    cached = _RESPONSES.get(key)
+    if cached is None:
+        return None
+
+    expires_at, response = cached
+    if time.monotonic() < expires_at:
+        return response
+    _RESPONSES.pop(key, None)
+    return None
+
+
+async def coalesce(
+    key: Hashable,
+    factory: Callable[[], Awaitable[dict[str, Any]]],
+    ttl: float | None = None,
+) -> dict[str, Any]:
+    """Run a read-only tool call once for all concurrent identical requests.
+
+    Args:
+        key: Hashable identifier of the request (backend, method and arguments)
+        factory: Zero-argument callable returning the awaitable that does the work
+        ttl: Seconds to reuse a successful response; defaults to the global cache TTL
+
+    Returns:
+        The tool response, shared with every caller using the same key
+
+    """
+    response = cached_response(key)
+    if response is not None:
+        return response
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = task
+        response_ttl = _RESPONSE_TTL if ttl is None else ttl
+        task.add_done_callback(lambda done: _complete(key, done, response_ttl))
+
+    # Shield the shared task so one cancelled caller does not cancel the others
+    return await asyncio.shield(task)
+
+
+def _complete(key: Hashable, task: asyncio.Task, ttl: float) -> None:
+    """Release an in-flight entry and cache its response if it succeeded.
+
+    Args:
+        key: The request key the task was registered under
+        task: The finished task
+        ttl: Seconds to keep the response; 0 or less skips caching
+
+    """
+    # A task dropped by clear_cache() started before the reload; never cache it
+    if _INFLIGHT.get(key) is not task:
+        return
+    del _INFLIGHT[key]
+    if ttl <= 0 or task.cancelled() or task.exception() is not None:
+        return
+
+    response = task.result()
+    if not _has_error(response):
+        _RESPONSES[key] = (time.monotonic() + ttl, response)
+
+
+def _has_error(response: dict[str, Any]) -> bool:
+    """Check whether a response reports a failure, globally or for any host.
+
+    Args:
+        response: Tool response to inspect
+
+    Returns:
+        True if the response or any per-host entry of its data is an error
+
+    """
+    if "error" in response:
+        return True
+    data = response.get("data")
+    if not isinstance(data, dict):
+        return False
+    return any(isinstance(value, dict) and "error" in value for value in data.values())
+
+
+def clear_cache() -> None:
+    """Drop all cached responses, e.g. after the inventory is reloaded.
+
+    In-flight executions are forgotten as well, so later callers start a
+    fresh run instead of joining one that predates the reload, and the
+    stale result is not cached when it completes.
+    """
+    _INFLIGHT.clear()
+    _RESPONSES.clear()
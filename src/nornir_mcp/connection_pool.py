@@ -0,0 +1,333 @@
+"""Idle tracking and eviction for device connections kept open by Nornir.
+
+Nornir caches every connection a task opens on ``host.connections`` and reuses
+it across runs, so repeated tool calls against the same device skip the
+SSH/NETCONF handshake. Left alone, those sessions stay open until the process
+exits. This module records when each connection was opened and last used,
+closes the ones that have been idle or alive for too long, caps how many are
+kept, and drops them all when the inventory is reloaded.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import Any, TypeVar
+
+from nornir.core import Nornir
+from nornir.core.inventory import Host
+
+from .constants import DefaultValue, EnvVar, ErrorType
+from .types import MCPException
+
+_N = TypeVar("_N", int, float)
+
+# Identifies a device endpoint: (username, hostname, port)
+EndpointKey = tuple[str | None, str | None, int | None]
+# Identifies one open connection to an endpoint: (username, hostname, port, connection plugin)
+ConnectionKey = tuple[str | None, str | None, int | None, str]
+
+
+def _endpoint_key(host: Host) -> EndpointKey:
+    """Build the pool key of the endpoint a host connects to.
+
+    Args:
+        host: Nornir inventory host
+
+    Returns:
+        Tuple of (username, hostname, port)
+
+    """
+    return (host.username, host.hostname, host.port)
+
+
+class ConnectionPool:
+    """Keeps Nornir host connections open between runs and evicts idle ones.
+
+    Connections are tracked per endpoint and connection plugin. Hosts taking
+    part in a run are leased for its duration so that eviction never closes a
+    connection that a task is using. Leases are exclusive per endpoint: Netmiko
+    and Paramiko sessions are not thread-safe, so a run that targets a device
+    already in use by another run waits until that run has finished, or until
+    the lease timeout expires.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float,
+        enabled: bool = True,
+        max_age: float = float("inf"),
+        max_size: int | None = None,
+        lease_timeout: float | None = None,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            idle_ttl: Seconds a connection may stay unused before it is closed
+            enabled: When False, connections are closed as soon as a run finishes
+            max_age: Seconds after which a connection is recycled once it is idle
+            max_size: Maximum number of pooled connections; the least recently
+                used idle ones are closed beyond it. None means unbounded
+            lease_timeout: Seconds a run waits for devices held by other runs
+                before giving up. None means it waits indefinitely
+
+        """
+        self.idle_ttl = idle_ttl
+        self.enabled = enabled
+        self.max_age = max_age
+        self.max_size = max_size
+        self.lease_timeout = lease_timeout
+        # Nornir runs tasks from a thread pool, so all state changes go through this lock
+        self._lock = threading.RLock()
+        # Signalled whenever a lease ends, waking runs waiting for the same endpoints
+        self._released = threading.Condition(self._lock)
+        # (last used, first seen, owning host) per pooled connection
+        self._last_used: dict[ConnectionKey, tuple[float, float, Host]] = {}
+        self._in_use: set[EndpointKey] = set()
+        self._timer: threading.Timer | None = None
+
+    @contextmanager
+    def lease(self, nr: Nornir) -> Iterator[set[str]]:
+        """Reserve the hosts of a (filtered) Nornir object while a run executes.
+
+        Blocks until no other lease holds any of the endpoints. When the run
+        finishes, the connections it opened or reused are recorded as freshly
+        used, or closed right away if pooling is disabled or their host failed.
+
+        Args:
+            nr: Nornir object whose hosts take part in the run
+
+        Yields:
+            Set to which the caller adds the names of failed hosts; their
+            connections may be in an unknown state and are not reused
+
+        Raises:
+            MCPException: If the endpoints are still held by another run after the lease timeout
+
+        """
+        hosts = list(nr.inventory.hosts.values())
+        endpoints = {_endpoint_key(host) for host in hosts}
+        with self._released:
+            # Take all endpoints at once, so two runs never each hold part of the other's target.
+            # A run stuck on an unresponsive device must not block every later call forever.
+            if not self._released.wait_for(lambda: self._in_use.isdisjoint(endpoints), self.lease_timeout):
+                busy = sorted(host.name for host in hosts if _endpoint_key(host) in self._in_use)
+                raise MCPException(
+                    ErrorType.HOSTS_BUSY,
+                    f"Timed out after {self.lease_timeout:g}s waiting for hosts in use by another "
+                    f"tool call: {', '.join(busy)}",
+                )
+            self._in_use.update(endpoints)
+
+        failed: set[str] = set()
+        try:
+            yield failed
+        except BaseException:
+            failed.update(host.name for host in hosts)
+            raise
+        finally:
+            self._release(hosts, endpoints, failed)
+
+    def evict_idle(self) -> int:
+        """Close every connection that is idle for at least the TTL or older than the max age.
+
+        Returns:
+            Number of connections closed
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._timer = None
+            expired = [
+                (key, host)
+                for key, (last_used, created, host) in self._last_used.items()
+                if key[:3] not in self._in_use and now >= self._expires_at(last_used, created)
+            ]
+            closing = [self._detach(key, host) for key, host in expired]
+            self._schedule()
+        _close_connections(closing)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close all tracked connections that are not in use, e.g. before an inventory reload."""
+        with self._lock:
+            closing = [
+                self._detach(key, host)
+                for key, (_, _, host) in list(self._last_used.items())
+                if key[:3] not in self._in_use
+            ]
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._schedule()
+        _close_connections(closing)
+
+    def _release(self, hosts: list[Host], endpoints: set[EndpointKey], failed: set[str]) -> None:
+        """End the lease of hosts and record or close their connections.
+
+        Args:
+            hosts: Hosts that took part in the finished run
+            endpoints: Endpoints reserved by the lease
+            failed: Names of hosts whose task failed
+
+        """
+        now = time.monotonic()
+        closing = []
+        # Waiters are woken and detached sessions closed even if the bookkeeping fails
+        try:
+            with self._released:
+                self._in_use.difference_update(endpoints)
+                try:
+                    for host in hosts:
+                        endpoint = _endpoint_key(host)
+                        for connection in list(host.connections):
+                            key = (*endpoint, connection)
+                            if self.enabled and host.name not in failed:
+                                previous = self._last_used.get(key)
+                                created = previous[1] if previous is not None and previous[2] is host else now
+                                self._last_used[key] = (now, created, host)
+                            else:
+                                self._last_used.pop(key, None)
+                                closing.append(host.connections.pop(connection))
+                    closing.extend(self._enforce_max_size())
+                    self._schedule()
+                finally:
+                    self._released.notify_all()
+        finally:
+            _close_connections(closing)
+
+    def _detach(self, key: ConnectionKey, host: Host) -> Any:
+        """Stop tracking a connection and take it off its host.
+
+        Must be called with the lock held. Once detached, no later run can pick
+        the connection up, so it can be closed after the lock is released.
+
+        Args:
+            key: Pool key of the connection
+            host: Host owning the connection
+
+        Returns:
+            The detached connection plugin, or None if the host no longer had it
+
+        """
+        del self._last_used[key]
+        return host.connections.pop(key[3], None)
+
+    def _enforce_max_size(self) -> list[Any]:
+        """Detach least recently used idle connections while the pool is over its size cap.
+
+        Must be called with the lock held.
+
+        Returns:
+            The detached connections, to be closed once the lock is released
+
+        """
+        if self.max_size is None or len(self._last_used) <= self.max_size:
+            return []
+
+        # Sort on the timestamp alone: keys may hold None and cannot be compared on ties
+        idle = sorted(
+            (key for key in self._last_used if key[:3] not in self._in_use),
+            key=lambda key: self._last_used[key][0],
+        )
+        return [
+            self._detach(key, self._last_used[key][2]) for key in idle[: len(self._last_used) - self.max_size]
+        ]
+
+    def _expires_at(self, last_used: float, created: float) -> float:
+        """Return the monotonic time at which a connection becomes eligible for eviction.
+
+        Args:
+            last_used: When the connection was last used
+            created: When the connection was first pooled
+
+        Returns:
+            The earlier of the idle deadline and the max-age deadline
+
+        """
+        return min(last_used + self.idle_ttl, created + self.max_age)
+
+    def _schedule(self) -> None:
+        """Arm the eviction timer for the connection that will expire first.
+
+        Must be called with the lock held.
+        """
+        if self._timer is not None:
+            return
+
+        # Leased connections are refreshed when their run ends, which re-arms the timer
+        deadlines = [
+            self._expires_at(last_used, created)
+            for key, (last_used, created, _) in self._last_used.items()
+            if key[:3] not in self._in_use
+        ]
+        if not deadlines:
+            return
+
+        delay = max(min(deadlines) - time.monotonic(), 0.0)
+        self._timer = threading.Timer(delay, self.evict_idle)
+        self._timer.daemon = True
+        self._timer.start()
+
+
+def _close_connections(connections: list[Any]) -> None:
+    """Close detached connections, ignoring failures from already-dead sessions.
+
+    Called without the pool lock held, since closing a session can block on the network.
+
+    Args:
+        connections: Connection plugins taken off their hosts
+
+    """
+    for connection in connections:
+        if connection is not None:
+            with suppress(Exception):
+                connection.close()
+
+
+def _env_number(name: str, default: str, parse: Callable[[str], _N]) -> _N:
+    """Read a numeric setting from the environment, falling back to its default.
+
+    Args:
+        name: Environment variable name
+        default: Default value, used when the variable is unset or not a number
+        parse: Conversion to apply, e.g. ``int`` or ``float``
+
+    Returns:
+        The parsed setting
+
+    """
+    try:
+        return parse(os.getenv(name, default))
+    except ValueError:
+        return parse(default)
+
+
+_POOL: ConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use.
+
+    Returns:
+        The shared ConnectionPool instance
+
+    """
+    global _POOL
+
+    pool = _POOL
+    if pool is not None:
+        return pool
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ConnectionPool(
+                idle_ttl=_env_number(EnvVar.POOL_IDLE_TTL, DefaultValue.POOL_IDLE_TTL, float),
+                enabled=os.getenv(EnvVar.DISABLE_POOL, DefaultValue.DISABLE_POOL) != "1",
+                max_age=_env_number(EnvVar.POOL_MAX_AGE, DefaultValue.POOL_MAX_AGE, float),
+                max_size=_env_number(EnvVar.POOL_MAX_SIZE, DefaultValue.POOL_MAX_SIZE, int),
+                lease_timeout=_env_number(EnvVar.POOL_LEASE_TIMEOUT, DefaultValue.POOL_LEASE_TIMEOUT, float),
+            )
+    return _POOL
@@ -13,6 +13,7 @@ class ErrorType(StrEnum):
     NO_HOSTS = "no_hosts"
     INVALID_PARAMETERS = "invalid_parameters"
     INVALID_GETTER = "invalid_getter"
+    UNSUPPORTED_GETTER = "unsupported_getter"
     INVALID_COMMAND = "invalid_command"
     EXECUTION_FAILED = "execution_failed"
     EXECUTION_ERROR = "execution_error"
@@ -23,6 +24,7 @@ class ErrorType(StrEnum):
     NETMIKO_COMMANDS_RETRIEVAL_FAILED = "netmiko_commands_retrieval_failed"
     NETMIKO_COMMANDS_NOT_FOUND = "netmiko_commands_not_found"
     RELOAD_FAILED = "reload_failed"
+    HOSTS_BUSY = "hosts_busy"
     TOOL_ERROR = "tool_error"
 
 
@@ -53,6 +55,19 @@ class EnvVar(StrEnum):
     """Environment variable names."""
 
     NORNIR_CONFIG_FILE = "NORNIR_CONFIG_FILE"
+    CACHE_TTL = "NORNIR_MCP_CACHE_TTL"
+    FACTS_CACHE_TTL = "NORNIR_MCP_FACTS_CACHE_TTL"
+    NAPALM_CONCURRENCY = "NORNIR_MCP_NAPALM_CONCURRENCY"
+    NETMIKO_CONCURRENCY = "NORNIR_MCP_NETMIKO_CONCURRENCY"
+    PARAMIKO_CONCURRENCY = "NORNIR_MCP_PARAMIKO_CONCURRENCY"
+    SSH_KEEPALIVE = "NORNIR_MCP_SSH_KEEPALIVE"
+    TCP_NODELAY = "NORNIR_MCP_TCP_NODELAY"
+    DISABLE_POOL = "NORNIR_MCP_DISABLE_POOL"
+    POOL_IDLE_TTL = "NORNIR_MCP_POOL_IDLE_TTL"
+    POOL_MAX_AGE = "NORNIR_MCP_POOL_MAX_AGE"
+    POOL_MAX_SIZE = "NORNIR_MCP_POOL_MAX_SIZE"
+    POOL_LEASE_TIMEOUT = "NORNIR_MCP_POOL_LEASE_TIMEOUT"
+    WORKERS = "NORNIR_MCP_WORKERS"
 
 
 class DefaultValue(StrEnum):
@@ -60,3 +75,16 @@ class DefaultValue(StrEnum):
 
     CONFIG_FILENAME = "config.yaml"
     CAPABILITIES_FILENAME = "capabilities.yaml"
+    CACHE_TTL = "2"
+    FACTS_CACHE_TTL = "60"
+    NAPALM_CONCURRENCY = "16"
+    NETMIKO_CONCURRENCY = "8"
+    PARAMIKO_CONCURRENCY = "8"
+    SSH_KEEPALIVE = "30"
+    TCP_NODELAY = "1"
+    DISABLE_POOL = "0"
+    POOL_IDLE_TTL = "600"
+    POOL_MAX_AGE = "3600"
+    POOL_MAX_SIZE = "100"
+    POOL_LEASE_TIMEOUT = "300"
+    WORKERS = "32"
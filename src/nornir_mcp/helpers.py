@@ -4,17 +4,39 @@ This module contains all shared helper functions used across multiple modules
 to reduce code duplication and improve maintainability.
 """
 
-from .constants import ErrorType, TargetType
+from .constants import DefaultValue, EnvVar, ErrorType, TargetType
 from .types import error_response, MCPException, MCPError
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
+import base64
+import json
+import socket
 import tarfile
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (``nornir-mcp[speedups]``)
+    orjson = None
 
+# Seconds between SSH keepalive packets on tuned transports; 0 disables keepalives
+_SSH_KEEPALIVE = int(os.getenv(EnvVar.SSH_KEEPALIVE, DefaultValue.SSH_KEEPALIVE))
+# Whether to disable Nagle's algorithm on tuned SSH sockets
+_TCP_NODELAY = os.getenv(EnvVar.TCP_NODELAY, DefaultValue.TCP_NODELAY) == "1"
+# Socket buffer size: ten times the common 32 KiB maximum SSH packet size
+_SSH_SOCKET_BUFFER = 10 * 32768
+# Sentinel distinguishing a missing key from a key mapped to None
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
 def format_target(host_name: str | None, group_name: str | None) -> str:
     """Format target description based on filtering parameters.
 
+    Results are cached, so repeated calls for the same group reuse one string.
+
     Args:
         host_name: Specific host name to target
         group_name: Specific group to target
@@ -38,24 +60,46 @@ def format_target(host_name: str | None, group_name: str | None) -> str:
     return TargetType.ALL
 
 
-def validate_target_params(host_name: str | None, group_name: str | None) -> None:
+def validate_target_params(host_name: str | None, group_name: str | None) -> str | None:
     """Validate that only one target parameter is specified.
 
+    Returns an error message instead of raising so that the common, valid
+    case does not pay for exception handling. Callers that rely on a
+    ValueError should use validate_target_params_or_raise.
+
     Args:
         host_name: Specific host name to target
         group_name: Specific group to target
 
-    Raises:
-        ValueError: If both host_name and group_name are specified
+    Returns:
+        Error message if both host_name and group_name are specified, otherwise None
 
     Examples:
         >>> validate_target_params("host1", None)  # OK
         >>> validate_target_params(None, "group1")  # OK
-        >>> validate_target_params("host1", "group1")  # Raises ValueError
+        >>> validate_target_params("host1", "group1")
+        'Cannot specify both host_name and group_name'
 
     """
     if host_name and group_name:
-        raise ValueError("Cannot specify both host_name and group_name")
+        return "Cannot specify both host_name and group_name"
+    return None
+
+
+def validate_target_params_or_raise(host_name: str | None, group_name: str | None) -> None:
+    """Validate target parameters, raising on invalid combinations.
+
+    Args:
+        host_name: Specific host name to target
+        group_name: Specific group to target
+
+    Raises:
+        ValueError: If both host_name and group_name are specified
+
+    """
+    error = validate_target_params(host_name, group_name)
+    if error:
+        raise ValueError(error)
 
 
 def extract_single_key(data: Any, key: str) -> Any:
@@ -76,8 +120,10 @@ def extract_single_key(data: Any, key: str) -> Any:
         >>> extract_single_key([1, 2, 3], "a")
         [1, 2, 3]
     """
-    if isinstance(data, dict) and key in data:
-        return data[key]
+    if isinstance(data, dict):
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
     return data
 
 
@@ -174,3 +220,97 @@ def validate_file_operation_params(local_path: str | None, remote_path: str | No
         raise ValueError(f"Local {path_type} does not exist: {local_path}")
 
 
+def parse_getters(getters: Sequence[str] | str) -> list[str]:
+    """Normalize a getters argument into a list of getter names.
+
+    LLM clients frequently pass lists as JSON text, so strings are accepted as
+    either a JSON array or a comma-separated list of names. Only strings that
+    look like an array are handed to the JSON parser (orjson when installed).
+
+    Args:
+        getters: Sequence of getter names, a JSON array string, or comma-separated names
+
+    Returns:
+        List of getter names
+
+    Raises:
+        ValueError: If a JSON string is malformed or is not an array of strings
+
+    Examples:
+        >>> parse_getters('["facts", "interfaces"]')
+        ['facts', 'interfaces']
+        >>> parse_getters("facts, arp_table")
+        ['facts', 'arp_table']
+    """
+    if not isinstance(getters, str):
+        return list(getters)
+
+    text = getters.strip()
+    if not text.startswith("["):
+        return [name.strip() for name in text.split(",") if name.strip()]
+
+    try:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        parsed = orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError as e:
+        raise ValueError(f"Invalid getters JSON: {e}") from e
+
+    if not isinstance(parsed, list) or not all(isinstance(name, str) for name in parsed):
+        raise ValueError("Getters must be a JSON array of strings")
+    return parsed
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values JSON cannot represent natively.
+
+    Args:
+        value: Object that the JSON encoder could not serialize
+
+    Returns:
+        Base64 text for bytes, ISO 8601 text for dates, otherwise ``str(value)``
+    """
+    if isinstance(value, bytes | bytearray):
+        return base64.b64encode(value).decode("ascii")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def serialize_result(data: Any) -> str:
+    """Serialize a tool result to JSON text for the MCP response.
+
+    Uses orjson when it is installed, which is considerably faster than the
+    standard library on large payloads such as ARP or MAC address tables.
+
+    Args:
+        data: Tool result to serialize
+
+    Returns:
+        Compact JSON representation of the result
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=_json_default, separators=(",", ":"))
+
+
+def tune_ssh_transport(transport: Any) -> None:
+    """Tune a Paramiko transport for interactive, small-record SSH traffic.
+
+    Enables keepalives so idle sessions are not dropped by firewalls between
+    LLM requests, and, unless disabled, sets TCP_NODELAY and enlarges the
+    socket buffers so short command outputs are not delayed by Nagle's algorithm.
+
+    Args:
+        transport: Paramiko Transport of an open SSH session, or None
+    """
+    if transport is None:
+        return
+
+    transport.set_keepalive(_SSH_KEEPALIVE)
+
+    # Proxied transports wrap a non-socket channel that cannot be tuned
+    sock = getattr(transport, "sock", None)
+    if _TCP_NODELAY and isinstance(sock, socket.socket):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SSH_SOCKET_BUFFER)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SSH_SOCKET_BUFFER)
@@ -6,11 +6,13 @@ tools for network automation tasks.
 
 from fastmcp import FastMCP
 
+from nornir_mcp.helpers import orjson, serialize_result
 from nornir_mcp.resources import get_getters, get_netmiko_commands
 from nornir_mcp.tools import (
     download_directory,
     download_file,
     get_device_data,
+    get_device_snapshot,
     list_nornir_inventory,
     reload_nornir_inventory,
     run_cli_commands,
@@ -22,7 +24,9 @@ from nornir_mcp.tools import (
 
 def main():
     """Initialize and run the Nornir MCP server."""
-    mcp = FastMCP("nornir-mcp")
+    # Without orjson, FastMCP's pydantic_core serializer beats the stdlib fallback
+    tool_serializer = serialize_result if orjson is not None else None
+    mcp = FastMCP("nornir-mcp", tool_serializer=tool_serializer)
 
     # Register Tools
     mcp.tool(list_nornir_inventory)
@@ -30,6 +34,7 @@ def main():
 
     # Device Interaction
     mcp.tool(get_device_data)
+    mcp.tool(get_device_snapshot)
     mcp.tool(run_cli_commands)
 
     # Linux/Paramiko Interaction
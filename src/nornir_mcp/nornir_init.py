@@ -10,6 +10,7 @@ import threading
 from nornir import InitNornir
 from nornir.core import Nornir
 
+from .connection_pool import get_connection_pool
 from .constants import DefaultValue, EnvVar
 
 # Module-level variable to store the Nornir instance
@@ -27,6 +28,12 @@ def get_nornir() -> Nornir:
     """
     global _NORNIR_INSTANCE
 
+    # Fast path: the instance is only ever swapped by a single assignment, so an
+    # already-initialized instance can be returned without taking the lock
+    nr = _NORNIR_INSTANCE
+    if nr is not None:
+        return nr
+
     with _LOCK:
         if _NORNIR_INSTANCE is None:
             config_file = _locate_config_file()
@@ -42,6 +49,7 @@ def reset_nornir() -> None:
 
     This clears the current Nornir instance and creates a new one,
     effectively reloading the inventory from the configuration file.
+    Idle device connections held by the previous instance are closed.
     """
     global _NORNIR_INSTANCE
 
@@ -51,6 +59,7 @@ def reset_nornir() -> None:
             _NORNIR_INSTANCE = InitNornir(config_file=config_file)
     except Exception as e:
         raise RuntimeError(f"Failed to reload Nornir: {e}") from e
+    get_connection_pool().close_all()
 
 
 def _locate_config_file() -> str:
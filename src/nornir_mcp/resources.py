@@ -16,16 +16,27 @@ Example:
 
 """
 
+import threading
 from functools import lru_cache
 from importlib import resources
+from operator import attrgetter
 from typing import Any
 
 import yaml
+from nornir.core import Nornir
 
 from .constants import ConfigKey, DefaultValue, ErrorType
 from .nornir_init import get_nornir
 from .helpers import error_response
 
+# Inventory summary together with the Nornir instance it was built from. A reload
+# replaces the instance, which invalidates the summary without extra bookkeeping.
+_INVENTORY_SNAPSHOT: tuple[Nornir, dict[str, Any]] | None = None
+_INVENTORY_LOCK = threading.Lock()
+
+# Host attributes read for every host in the summary, fetched in one call
+_HOST_FIELDS = attrgetter("hostname", "platform", "groups")
+
 
 def get_inventory() -> dict[str, Any]:
     """Retrieve the current Nornir inventory details.
@@ -34,6 +45,9 @@ def get_inventory() -> dict[str, Any]:
     and groups from the Nornir inventory. This includes host names,
     IP addresses, platform types, and group memberships.
 
+    The summary is built once per Nornir instance and reused until the
+    inventory is reloaded.
+
     Returns:
         Dictionary containing all hosts with their basic information
         (name, IP address, platform) and groups information.
@@ -63,38 +77,58 @@ def get_inventory() -> dict[str, Any]:
         Exception: If inventory retrieval fails due to configuration issues
 
     """
+    global _INVENTORY_SNAPSHOT
+
     try:
         nr = get_nornir()
 
-        # Get hosts information
-        hosts = {}
-        for host_name, host_obj in nr.inventory.hosts.items():
-            hosts[host_name] = {
-                "name": host_name,
-                "ip": host_obj.hostname,
-                "platform": host_obj.platform,
-                "groups": [group.name for group in host_obj.groups] if host_obj.groups else [],
-            }
+        snapshot = _INVENTORY_SNAPSHOT
+        if snapshot is not None and snapshot[0] is nr:
+            return snapshot[1]
 
-        # Get groups information
-        groups = {}
-        for group_name, group_obj in nr.inventory.groups.items():
-            groups[group_name] = {
-                "name": group_name,
-                "platform": group_obj.platform,
-                "hosts": [
-                    h
-                    for h, host_obj in nr.inventory.hosts.items()
-                    if group_name in [g.name for g in host_obj.groups]
-                ],
-            }
+        with _INVENTORY_LOCK:
+            # Another thread may have built the summary while we waited for the lock
+            snapshot = _INVENTORY_SNAPSHOT
+            if snapshot is not None and snapshot[0] is nr:
+                return snapshot[1]
 
-        return {"hosts": hosts, "groups": groups, "total_hosts": len(hosts), "total_groups": len(groups)}
+            inventory = _summarize_inventory(nr)
+            _INVENTORY_SNAPSHOT = (nr, inventory)
+        return inventory
 
     except Exception as e:
         return error_response(ErrorType.INVENTORY_RETRIEVAL_FAILED, str(e))
 
 
+def _summarize_inventory(nr: Nornir) -> dict[str, Any]:
+    """Build the host and group summary returned by get_inventory.
+
+    Args:
+        nr: Nornir instance whose inventory is summarized
+
+    Returns:
+        Dictionary with hosts, groups and their totals
+
+    """
+    # Collect host details and group membership in a single pass over the hosts
+    group_members: dict[str, list[str]] = {group_name: [] for group_name in nr.inventory.groups}
+    hosts = {}
+    for host_name, host_obj in nr.inventory.hosts.items():
+        ip, platform, host_groups = _HOST_FIELDS(host_obj)
+        group_names = [group.name for group in host_groups] if host_groups else []
+        hosts[host_name] = {"name": host_name, "ip": ip, "platform": platform, "groups": group_names}
+        for group_name in group_names:
+            if group_name in group_members:
+                group_members[group_name].append(host_name)
+
+    groups = {
+        group_name: {"name": group_name, "platform": group_obj.platform, "hosts": group_members[group_name]}
+        for group_name, group_obj in nr.inventory.groups.items()
+    }
+
+    return {"hosts": hosts, "groups": groups, "total_hosts": len(hosts), "total_groups": len(groups)}
+
+
 @lru_cache(maxsize=1)
 def _load_capabilities() -> dict[str, Any]:
     """Load and cache capabilities YAML (thread-safe).
@@ -4,15 +4,52 @@ This module defines the base class for all network automation runners,
 providing common functionality and interface for device interaction.
 """
 
+import copy
+import os
 from collections.abc import Callable
 from typing import Any
 
 from nornir.core import Nornir
-from nornir.core.filter import F
+from nornir.core.inventory import Host, Hosts, Inventory
 from nornir.core.task import AggregatedResult, MultiResult
+from nornir.plugins.runners import ThreadedRunner
 
-from nornir_mcp.constants import ErrorType
-from nornir_mcp.types import MCPException
+from nornir_mcp.connection_pool import get_connection_pool
+from nornir_mcp.constants import DefaultValue, EnvVar, ErrorType
+from nornir_mcp.types import MCPException, truncate_message
+
+# Upper bound on threads used to fan a single run out across hosts
+_MAX_WORKERS = int(os.getenv(EnvVar.WORKERS, DefaultValue.WORKERS))
+
+# Hosts per group name for the current inventory, rebuilt when the inventory object changes
+_GROUP_INDEX: tuple[Inventory, dict[str, dict[str, Host]]] | None = None
+
+
+def _group_index(inventory: Inventory) -> dict[str, dict[str, Host]]:
+    """Return the hosts of an inventory indexed by the groups they directly belong to.
+
+    The index is built once per inventory object, so reloading the inventory
+    (which creates a new Nornir instance) rebuilds it on the next lookup.
+
+    Args:
+        inventory: Nornir inventory to index
+
+    Returns:
+        Mapping of group name to the hosts in that group, keyed by host name
+
+    """
+    global _GROUP_INDEX
+
+    cached = _GROUP_INDEX
+    if cached is not None and cached[0] is inventory:
+        return cached[1]
+
+    index: dict[str, dict[str, Host]] = {}
+    for name, host in inventory.hosts.items():
+        for group in host.groups:
+            index.setdefault(group.name, {})[name] = host
+    _GROUP_INDEX = (inventory, index)
+    return index
 
 
 class BaseRunner:
@@ -31,6 +68,33 @@ class BaseRunner:
         """
         self.nornir = nornir
 
+    def filter_hosts(self, host_name: str | None = None, group_name: str | None = None) -> Nornir:
+        """Return the Nornir instance narrowed down to the requested target.
+
+        Args:
+            host_name: Specific host name to target, or None for all hosts
+            group_name: Specific group to target, or None for all hosts
+
+        Returns:
+            Nornir instance filtered to the target hosts
+
+        """
+        nr = self.nornir
+        inventory = nr.inventory
+        # Direct lookups replace nr.filter(name=...) and nr.filter(F(groups__contains=...)),
+        # which evaluate the filter against every host in the inventory
+        if host_name:
+            host = inventory.hosts.get(host_name)
+            hosts = {host_name: host} if host is not None else {}
+        elif group_name:
+            hosts = _group_index(inventory).get(group_name, {})
+        else:
+            return nr
+
+        nr = copy.copy(nr)
+        nr.inventory = Inventory(hosts=Hosts(hosts), groups=inventory.groups, defaults=inventory.defaults)
+        return nr
+
     def run_on_hosts(
         self,
         task: Callable[..., Any],
@@ -50,12 +114,26 @@ class BaseRunner:
             AggregatedResult containing the execution results
 
         """
-        nr = self.nornir
-        if host_name:
-            nr = nr.filter(name=host_name)
-        elif group_name:
-            nr = nr.filter(F(groups__contains=group_name))
-        return nr.run(task=task, **kwargs)
+        nr = self.filter_hosts(host_name, group_name)
+        if isinstance(nr.runner, ThreadedRunner):
+            # Shrink the thread pool to the target size; never exceed the configured runner or the cap
+            num_workers = max(1, min(_MAX_WORKERS, nr.runner.num_workers, len(nr.inventory.hosts)))
+            if num_workers != nr.runner.num_workers:
+                nr = nr.with_runner(ThreadedRunner(num_workers=num_workers))
+        # Connections opened by the task stay on the hosts for reuse by later runs
+        with get_connection_pool().lease(nr) as failed_hosts:
+            result = nr.run(task=task, **kwargs)
+            # A failed task may leave its session mid-command, so it is not reused. Some tasks
+            # (e.g. Paramiko) catch their errors and report them as an error dict instead.
+            failed_hosts.update(result.failed_hosts)
+            failed_hosts.update(
+                name
+                for name, multi_result in result.items()
+                if multi_result
+                and isinstance(multi_result[0].result, dict)
+                and "error" in multi_result[0].result
+            )
+            return result
 
     def process_results(
         self, aggregated_result: AggregatedResult, extractor: Callable[[Any], Any] | None = None
@@ -76,44 +154,56 @@ class BaseRunner:
         if not aggregated_result:
             raise MCPException(ErrorType.NO_HOSTS, "No hosts found for the given target.")
 
-        processed_data = {}
-        for hostname, multi_result in aggregated_result.items():
-            # Check if multi_result is empty to avoid IndexError
-            if len(multi_result) == 0:
-                # For individual host failures, we still return success at the aggregate level
-                # but include the error in the data for that specific host
-                processed_data[hostname] = {
-                    "error": ErrorType.EXECUTION_FAILED,
-                    "message": "No task results available for this host",
-                }
-                continue
-
-            # Check if the multi_result is a MultiResult object with a failed attribute
-            # Otherwise, fall back to checking the first item's failed status
-            is_multi_result_failed = (
-                multi_result.failed
-                if isinstance(multi_result, MultiResult)
-                else (len(multi_result) > 0 and multi_result[0].failed)
+        return {
+            hostname: self._process_host_result(multi_result, extractor)
+            for hostname, multi_result in aggregated_result.items()
+        }
+
+    def _process_host_result(
+        self, multi_result: MultiResult, extractor: Callable[[Any], Any] | None = None
+    ) -> Any:
+        """Convert a single host's MultiResult into its standardized result.
+
+        Args:
+            multi_result: The MultiResult of one host
+            extractor: Optional function to extract specific data from the result
+
+        Returns:
+            The processed task output, or error details if the host failed
+
+        """
+        # Check if multi_result is empty to avoid IndexError
+        if len(multi_result) == 0:
+            # For individual host failures, we still return success at the aggregate level
+            # but include the error in the data for that specific host
+            return {
+                "error": ErrorType.EXECUTION_FAILED,
+                "message": "No task results available for this host",
+            }
+
+        # Check if the multi_result is a MultiResult object with a failed attribute
+        # Otherwise, fall back to checking the first item's failed status
+        is_multi_result_failed = (
+            multi_result.failed
+            if isinstance(multi_result, MultiResult)
+            else (len(multi_result) > 0 and multi_result[0].failed)
+        )
+
+        if is_multi_result_failed:
+            # Find the actual task that failed
+            failed_task = next((r for r in multi_result if hasattr(r, "failed") and r.failed), None)
+            error_message = (
+                truncate_message(str(failed_task.exception)) if failed_task else "Unknown execution failure"
             )
 
-            if is_multi_result_failed:
-                # Find the actual task that failed
-                failed_task = next((r for r in multi_result if hasattr(r, "failed") and r.failed), None)
-                error_message = str(failed_task.exception) if failed_task else "Unknown execution failure"
-
-                processed_data[hostname] = {
-                    "error": ErrorType.EXECUTION_FAILED,
-                    "message": error_message,
-                }
-            else:
-                # Operation succeeded, safe to grab the first result
-                task_output = multi_result[0].result
-                if extractor:
-                    processed_data[hostname] = extractor(task_output)
-                else:
-                    processed_data[hostname] = task_output
-
-        return processed_data
+            return {
+                "error": ErrorType.EXECUTION_FAILED,
+                "message": error_message,
+            }
+
+        # Operation succeeded, safe to grab the first result
+        task_output = multi_result[0].result
+        return extractor(task_output) if extractor else task_output
 
     def raise_error(self, error_type: ErrorType | str, message: str) -> None:
         """Raise a standardized error.
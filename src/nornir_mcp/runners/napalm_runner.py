@@ -2,17 +2,51 @@
 
 This module provides NAPALM-specific task execution capabilities
 for the Nornir MCP server, handling device data retrieval operations.
+
+NAPALM and its driver stack are imported on first use rather than at module
+import, keeping server start-up fast for sessions that never query devices.
 """
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
-from nornir_napalm.plugins.tasks import napalm_get
+from nornir.core.task import Result, Task
 
 from nornir_mcp.constants import ErrorType
 
 from .base_runner import BaseRunner
 
 
+def get_supported_getters(task: Task, getters: Sequence[str]) -> Result:
+    """Run NAPALM getters on one host, reporting those its driver does not implement.
+
+    Unlike napalm_get, a getter that raises NotImplementedError on this
+    host's platform does not fail the whole task: it is reported in place
+    and the remaining getters still run over the same device session.
+
+    Args:
+        task: The Nornir task object for the current host
+        getters: The NAPALM getter methods to execute
+
+    Returns:
+        Result whose data maps each getter to its output or error details
+    """
+    from nornir_napalm.plugins.connections import CONNECTION_NAME  # noqa: PLC0415
+
+    device = task.host.get_connection(CONNECTION_NAME, task.nornir.config)
+    result = {}
+    for getter in getters:
+        method = getattr(device, getter if getter.startswith("get_") else f"get_{getter}")
+        try:
+            result[getter] = method()
+        except NotImplementedError:
+            result[getter] = {
+                "error": ErrorType.UNSUPPORTED_GETTER,
+                "message": f"Getter '{getter}' is not supported on platform '{task.host.platform}'",
+            }
+    return Result(host=task.host, result=result)
+
+
 class NapalmRunner(BaseRunner):
     """Runner for NAPALM-specific tasks.
 
@@ -40,26 +74,83 @@ class NapalmRunner(BaseRunner):
         if not getter:
             self.raise_error(ErrorType.INVALID_PARAMETERS, "Getter parameter is required")
 
-        try:
-            aggregated_result = self.run_on_hosts(
-                task=napalm_get, host_name=host_name, group_name=group_name, getters=[getter]
-            )
+        # Define an extractor to pull only the specific getter data
+        def extract_getter_data(task_output: Any) -> Any:
+            """Extractor function for NAPALM getter results.
+
+            This function extracts the specific getter data from NAPALM task output.
+
+            Args:
+                task_output: Raw output from the NAPALM getter task
+
+            Returns:
+                The specific getter data if task_output is a dict, otherwise the task_output unchanged
+            """
+            return task_output.get(getter) if isinstance(task_output, dict) else task_output
+
+        return self._run_napalm_get([getter], host_name, group_name, extractor=extract_getter_data)
+
+    def run_getters(
+        self, getters: Sequence[str], host_name: str | None = None, group_name: str | None = None
+    ) -> dict[str, Any]:
+        """Execute several NAPALM getters against devices in a single run.
+
+        All getters are collected over the same device session, so requesting
+        them together costs one connection round-trip per device instead of one
+        per getter. Getters a device's platform does not implement are reported
+        per host instead of failing the other getters on that host.
+
+        Args:
+            getters: The NAPALM getter methods to execute (e.g., ['facts', 'interfaces'])
+            host_name: Specific host name to target, or None for all hosts
+            group_name: Specific group to target, or None for all hosts
 
-            # Define an extractor to pull only the specific getter data
-            def extract_getter_data(task_output: Any) -> Any:
-                """Extractor function for NAPALM getter results.
+        Returns:
+            Dictionary mapping each host to a dictionary of getter results
 
-                This function extracts the specific getter data from NAPALM task output.
+        Raises:
+            MCPException: If the operation fails
 
-                Args:
-                    task_output: Raw output from the NAPALM getter task
+        """
+        if not getters or not all(getters):
+            self.raise_error(ErrorType.INVALID_PARAMETERS, "Getters parameter is required")
+
+        return self._run_napalm_get(list(getters), host_name, group_name, task=get_supported_getters)
+
+    def _run_napalm_get(
+        self,
+        getters: list[str],
+        host_name: str | None,
+        group_name: str | None,
+        extractor: Callable[[Any], Any] | None = None,
+        task: Callable[..., Result] | None = None,
+    ) -> dict[str, Any]:
+        """Run NAPALM getters on target hosts and process the per-host results.
 
-                Returns:
-                    The specific getter data if task_output is a dict, otherwise the task_output unchanged
-                """
-                return task_output.get(getter) if isinstance(task_output, dict) else task_output
+        Args:
+            getters: The NAPALM getter methods to execute
+            host_name: Specific host name to target, or None for all hosts
+            group_name: Specific group to target, or None for all hosts
+            extractor: Optional function to extract specific data from each host's result
+            task: Nornir task accepting a getters argument, napalm_get by default
 
-            return self.process_results(aggregated_result, extractor=extract_getter_data)
+        Returns:
+            Dictionary containing processed getter results
+
+        Raises:
+            MCPException: If the operation fails
+
+        """
+        if task is None:
+            from nornir_napalm.plugins.tasks import napalm_get  # noqa: PLC0415
+
+            task = napalm_get
+
+        try:
+            aggregated_result = self.run_on_hosts(
+                task=task, host_name=host_name, group_name=group_name, getters=getters
+            )
+            return self.process_results(aggregated_result, extractor=extractor)
 
         except ValueError as error:
             # NAPALM raises ValueError for invalid getters
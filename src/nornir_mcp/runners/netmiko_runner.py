@@ -2,17 +2,42 @@
 
 This module defines the NetmikoRunner class, which handles execution
 of commands using the Netmiko backend.
+
+Netmiko is imported inside the task that uses it, so the server can start
+without loading it.
 """
 
 from typing import Any
 
-from nornir_netmiko.tasks import netmiko_send_command
+from nornir.core.task import Result, Task
 
 from nornir_mcp.constants import ErrorType
 
+from ..helpers import tune_ssh_transport
 from .base_runner import BaseRunner
 
 
+def send_command_task(task: Task, **kwargs: Any) -> Result:
+    """Send a command with Netmiko after tuning the host's SSH transport.
+
+    Args:
+        task: The Nornir task object for the current host
+        **kwargs: Arguments passed through to netmiko_send_command
+
+    Returns:
+        The Result of netmiko_send_command
+    """
+    from nornir_netmiko.connections import CONNECTION_NAME  # noqa: PLC0415
+    from nornir_netmiko.tasks import netmiko_send_command  # noqa: PLC0415
+
+    connection = task.host.get_connection(CONNECTION_NAME, task.nornir.config)
+    # Telnet and serial connections have no Paramiko transport to tune
+    get_transport = getattr(getattr(connection, "remote_conn", None), "get_transport", None)
+    if get_transport is not None:
+        tune_ssh_transport(get_transport())
+    return netmiko_send_command(task, **kwargs)
+
+
 class NetmikoRunner(BaseRunner):
     """Runner for Netmiko automation backend.
 
@@ -47,7 +72,7 @@ class NetmikoRunner(BaseRunner):
 
         try:
             aggregated_result = self.run_on_hosts(
-                task=netmiko_send_command,
+                task=send_command_task,
                 host_name=host_name,
                 group_name=group_name,
                 command_string=command_string,
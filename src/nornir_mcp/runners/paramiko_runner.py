@@ -2,17 +2,21 @@
 
 This module defines the ParamikoRunner class, which handles execution
 of SSH commands and file operations using nornir-paramiko for Linux server management.
+
+nornir-paramiko is imported inside the methods that use it, so the Paramiko
+stack is only loaded once a Paramiko tool is actually called.
 """
 
 import os
+import shlex
 import tarfile
 import tempfile
+import threading
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
 from nornir.core.task import Task
-from nornir_paramiko.plugins.tasks import paramiko_command, paramiko_sftp
 
 from nornir_mcp.constants import ErrorType
 
@@ -20,6 +24,18 @@ from .base_runner import BaseRunner
 from ..helpers import extract_ssh_data, extract_upload_data, extract_download_data, extract_generic_data, is_safe_extract, validate_file_operation_params
 
 
+def _drain_stderr(channel: Any, chunks: list[bytes]) -> None:
+    """Read a channel's stderr until the remote command closes it.
+
+    Args:
+        channel: Paramiko channel running the remote command
+        chunks: List the stderr output is appended to
+
+    """
+    with suppress(OSError), channel.makefile_stderr() as remote_stderr:
+        chunks.append(remote_stderr.read())
+
+
 class ParamikoRunner(BaseRunner):
     """Runner for Paramiko automation backend.
 
@@ -50,6 +66,8 @@ class ParamikoRunner(BaseRunner):
         if not command:
             self.raise_error(ErrorType.INVALID_PARAMETERS, "Command parameter is required")
 
+        from nornir_paramiko.plugins.tasks import paramiko_command  # noqa: PLC0415
+
         def ssh_command_task(task: Task):
             """Execute SSH command on a single host using nornir-paramiko.
 
@@ -142,6 +160,8 @@ class ParamikoRunner(BaseRunner):
         Returns:
             A task function that can be used with Nornir
         """
+        from nornir_paramiko.plugins.tasks import paramiko_sftp  # noqa: PLC0415
+
         def file_operation_task(task: Task):
             """Generic file operation task for upload/download operations."""
             try:
@@ -342,37 +362,58 @@ class ParamikoRunner(BaseRunner):
         except ValueError as e:
             self.raise_error(ErrorType.INVALID_PARAMETERS, str(e))
 
-        def scp_upload_recursive_task(task: Task):
-            """Upload a directory to a single host via SSH command (replacing recursive SCP)."""
-            temp_path = None
-            try:
-                # Create a temporary tar file of the directory
-                with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp_file:
-                    temp_path = tmp_file.name
-
-                # Create a tar.gz archive of the local directory
-                with tarfile.open(temp_path, "w:gz") as tar:
-                    tar.add(local_path, arcname=os.path.basename(local_path))
+        from nornir_paramiko.plugins.connections import CONNECTION_NAME  # noqa: PLC0415
 
-                # Upload the archive using paramiko_sftp
-                # Using /tmp/ is intentional for temporary file transfer to remote system
-                task.run(
-                    task=paramiko_sftp,
-                    src=temp_path,
-                    dst=f"/tmp/{os.path.basename(temp_path)}",  # noqa: S108
-                    action="put",
-                )
-
-                # Extract the archive on the remote host using an SSH command
-                extract_cmd = (
-                    f'mkdir -p "{remote_path}" && '
-                    f'cd "{remote_path}" && '
-                    f'tar -xzf "/tmp/{os.path.basename(temp_path)}" && '
-                    f'rm "/tmp/{os.path.basename(temp_path)}"'
-                )
+        def scp_upload_recursive_task(task: Task):
+            """Upload a directory to a single host by streaming a tar archive over one SSH channel.
 
-                # Execute the extraction command
-                task.run(task=paramiko_command, command=extract_cmd)
+            The archive is generated on the fly and piped into ``tar`` on the remote host,
+            so the whole tree is transferred with a single exec request and no temporary
+            files on either side.
+            """
+            try:
+                client = task.host.get_connection(CONNECTION_NAME, task.nornir.config)
+                quoted_remote_path = shlex.quote(remote_path)
+                arcname = os.path.basename(os.path.normpath(local_path))
+
+                with client.get_transport().open_session() as channel:
+                    channel.exec_command(
+                        f"mkdir -p {quoted_remote_path} && tar -xzf - -C {quoted_remote_path}"
+                    )
+
+                    # Read stderr while the archive is sent, so a chatty remote tar cannot
+                    # stall the upload and an early mkdir or tar failure keeps its diagnostic
+                    stderr_chunks: list[bytes] = []
+                    stderr_reader = threading.Thread(
+                        target=_drain_stderr, args=(channel, stderr_chunks), daemon=True
+                    )
+                    stderr_reader.start()
+
+                    write_error = None
+                    try:
+                        # Stream the gzip-compressed archive straight into the remote tar's stdin
+                        with (
+                            channel.makefile("wb") as remote_stdin,
+                            tarfile.open(fileobj=remote_stdin, mode="w|gz", bufsize=65536) as tar,
+                        ):
+                            tar.add(local_path, arcname=arcname)
+                    except OSError as e:
+                        # The remote side stops reading once mkdir or tar fails; its stderr says why
+                        write_error = e
+                    finally:
+                        with suppress(OSError):
+                            channel.shutdown_write()
+
+                    stderr_reader.join()
+                    exit_status = channel.recv_exit_status()
+
+                stderr_data = b"".join(stderr_chunks).decode(errors="replace").strip()
+                if exit_status:
+                    raise RuntimeError(
+                        f"remote tar exited with status {exit_status}: {stderr_data or write_error}"
+                    )
+                if write_error is not None:
+                    raise write_error
 
                 return {
                     "local_path": local_path,
@@ -386,10 +427,6 @@ class ParamikoRunner(BaseRunner):
                     "message": f"Directory upload failed: {str(e)}",
                     "success": False,
                 }
-            finally:
-                # Clean up the temporary file if it was created
-                if temp_path and os.path.exists(temp_path):
-                    os.unlink(temp_path)
 
         try:
             # Use the parent class method to run the task on hosts
@@ -429,6 +466,8 @@ class ParamikoRunner(BaseRunner):
         if not local_path:
             self.raise_error(ErrorType.INVALID_PARAMETERS, "Local path parameter is required")
 
+        from nornir_paramiko.plugins.tasks import paramiko_command, paramiko_sftp  # noqa: PLC0415
+
         def scp_download_recursive_task(task: Task):
             """Download a directory from a single host via SSH command (replacing recursive SCP)."""
             temp_path = None
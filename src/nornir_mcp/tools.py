@@ -5,19 +5,79 @@ Protocol, allowing LLMs to interact with network devices through Nornir.
 """
 
 import asyncio
-from typing import Any
-
-from .constants import Backend, ErrorType
+import contextvars
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .cache import clear_cache, coalesce
+from .constants import Backend, DefaultValue, EnvVar, ErrorType
 from .nornir_init import get_nornir, reset_nornir
 from .resources import get_inventory
 from .runners.base_runner import BaseRunner
 from .runners.napalm_runner import NapalmRunner
 from .runners.netmiko_runner import NetmikoRunner
 from .runners.paramiko_runner import ParamikoRunner
-from .helpers import error_response
+from .helpers import error_response, parse_getters
 from .types import MCPException
 from .utils import format_target, validate_target_params
 
+_T = TypeVar("_T")
+
+# Per-backend limits on concurrent tool executions. They bound tool calls, not
+# SSH sessions: each call still fans out to up to NORNIR_MCP_WORKERS hosts at once
+_BACKEND_CONCURRENCY: dict[str, int] = {
+    Backend.NAPALM: int(os.getenv(EnvVar.NAPALM_CONCURRENCY, DefaultValue.NAPALM_CONCURRENCY)),
+    Backend.NETMIKO: int(os.getenv(EnvVar.NETMIKO_CONCURRENCY, DefaultValue.NETMIKO_CONCURRENCY)),
+    Backend.PARAMIKO: int(os.getenv(EnvVar.PARAMIKO_CONCURRENCY, DefaultValue.PARAMIKO_CONCURRENCY)),
+}
+_BACKEND_SEMAPHORES: dict[str, asyncio.Semaphore] = {
+    backend: asyncio.Semaphore(limit) for backend, limit in _BACKEND_CONCURRENCY.items()
+}
+
+# Dedicated pool for blocking Nornir calls. The default asyncio executor is sized
+# from the CPU count and could cap tool concurrency below the backend limits;
+# this one fits every backend at its limit plus one slot for inventory reloads.
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=sum(_BACKEND_CONCURRENCY.values()) + 1, thread_name_prefix="nornir-tool"
+)
+
+# Device facts (model, serial, OS version, interface list) rarely change and are
+# expensive to collect on some platforms, so they are cached longer than other getters
+_FACTS_CACHE_TTL = float(os.getenv(EnvVar.FACTS_CACHE_TTL, DefaultValue.FACTS_CACHE_TTL))
+
+# Constant per-tool metadata, built once and copied together with the per-call
+# fields into the single dict that becomes the tool result
+_NAPALM_META: dict[str, Any] = {"backend": Backend.NAPALM}
+_NETMIKO_META: dict[str, Any] = {"backend": Backend.NETMIKO}
+_SHELL_META: dict[str, Any] = {"backend": Backend.PARAMIKO}
+_UPLOAD_FILE_META: dict[str, Any] = {
+    "backend": Backend.PARAMIKO,
+    "operation": "upload",
+    "type": "file",
+    "protocol": "sftp",
+}
+_UPLOAD_DIRECTORY_META: dict[str, Any] = {
+    "backend": Backend.PARAMIKO,
+    "operation": "upload",
+    "type": "directory",
+    "protocol": "scp",
+}
+_DOWNLOAD_FILE_META: dict[str, Any] = {
+    "backend": Backend.PARAMIKO,
+    "operation": "download",
+    "type": "file",
+    "protocol": "sftp",
+}
+_DOWNLOAD_DIRECTORY_META: dict[str, Any] = {
+    "backend": Backend.PARAMIKO,
+    "operation": "download",
+    "type": "directory",
+    "protocol": "scp",
+}
+
 
 async def _run_tool(
     runner_cls: type[BaseRunner],
@@ -35,7 +95,7 @@ async def _run_tool(
         method_name: The method name to call on the runner
         host_name: Target host name or None for all hosts
         group_name: Target group name or None for all groups
-        result_meta: Metadata to include in the result
+        result_meta: Per-call metadata dict; it is extended in place to become the result
         *args: Arguments to pass to the runner method
         **kwargs: Keyword arguments to pass to the runner method
 
@@ -43,41 +103,100 @@ async def _run_tool(
         Dictionary containing the tool execution results with metadata
 
     """
-    try:
-        validate_target_params(host_name, group_name)
-    except ValueError as e:
-        return error_response(ErrorType.INVALID_PARAMETERS, str(e))
+    if target_error := validate_target_params(host_name, group_name):
+        return error_response(ErrorType.INVALID_PARAMETERS, target_error)
 
     nr = get_nornir()
     runner = runner_cls(nr)
 
     try:
         method = getattr(runner, method_name)
-        data = await asyncio.to_thread(method, *args, host_name=host_name, group_name=group_name, **kwargs)
-        return {
-            **result_meta,
-            "target": format_target(host_name, group_name),
-            "data": data,
-        }
+        async with _BACKEND_SEMAPHORES[result_meta["backend"]]:
+            data = await _to_thread(method, *args, host_name=host_name, group_name=group_name, **kwargs)
+        result_meta["target"] = format_target(host_name, group_name)
+        result_meta["data"] = data
+        return result_meta
     except MCPException as e:
         return error_response(e.error_type, e.message)
     except Exception as e:
         return error_response(ErrorType.EXECUTION_ERROR, str(e))
 
 
+async def _to_thread(func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+    """Run a blocking function in the tool executor, like asyncio.to_thread.
+
+    Args:
+        func: The blocking callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The return value of func
+
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_TOOL_EXECUTOR, functools.partial(context.run, func, *args, **kwargs))
+
+
+# Runner/method pairs bound once at import; tool wrappers only supply per-call arguments
+_run_getter = functools.partial(_run_tool, NapalmRunner, "run_getter")
+_run_getters = functools.partial(_run_tool, NapalmRunner, "run_getters")
+_run_command = functools.partial(_run_tool, NetmikoRunner, "run_command")
+_run_ssh_command = functools.partial(_run_tool, ParamikoRunner, "run_ssh_command")
+_sftp_upload = functools.partial(_run_tool, ParamikoRunner, "sftp_upload")
+_scp_upload_recursive = functools.partial(_run_tool, ParamikoRunner, "scp_upload_recursive")
+_sftp_download = functools.partial(_run_tool, ParamikoRunner, "sftp_download")
+_scp_download_recursive = functools.partial(_run_tool, ParamikoRunner, "scp_download_recursive")
+
+
 async def get_device_data(
     getter: str,
     host_name: str | None = None,
     group_name: str | None = None,
 ) -> dict[str, Any]:
-    """Execute a NAPALM getter on target network devices."""
-    return await _run_tool(
-        NapalmRunner,
-        "run_getter",
-        host_name,
-        group_name,
-        {"backend": Backend.NAPALM, "data_type": getter},
-        getter,
+    """Execute a NAPALM getter on target network devices.
+
+    To collect several getters, use get_device_snapshot, which fetches them in one session.
+    """
+    # Getters are read-only, so identical calls can share one execution and its cached
+    # response; a cache hit skips validation, runner creation and thread dispatch
+    return await coalesce(
+        (Backend.NAPALM, "run_getter", getter, host_name, group_name),
+        lambda: _run_getter(host_name, group_name, dict(_NAPALM_META, data_type=getter), getter),
+        ttl=_FACTS_CACHE_TTL if getter == "facts" else None,
+    )
+
+
+async def get_device_snapshot(
+    getters: list[str] | str,
+    host_name: str | None = None,
+    group_name: str | None = None,
+) -> dict[str, Any]:
+    """Execute several NAPALM getters on target network devices in one session.
+
+    Prefer this over repeated get_device_data calls when more than one getter is
+    needed: all getters share a single connection per device.
+
+    Args:
+        getters: NAPALM getters to execute (e.g., ['facts', 'interfaces', 'arp_table']),
+            also accepted as a JSON array string.
+        host_name: Specific host name to target.
+        group_name: Specific group to target.
+
+    """
+    try:
+        getter_names = parse_getters(getters)
+    except ValueError as e:
+        return error_response(ErrorType.INVALID_PARAMETERS, str(e))
+
+    # Normalize once: duplicates would be fetched twice, and the tuple doubles as the cache key
+    unique_getters = tuple(dict.fromkeys(getter_names))
+    return await coalesce(
+        (Backend.NAPALM, "run_getters", unique_getters, host_name, group_name),
+        lambda: _run_getters(
+            host_name, group_name, dict(_NAPALM_META, data_type=unique_getters), unique_getters
+        ),
     )
 
 
@@ -87,12 +206,10 @@ async def run_cli_commands(
     group_name: str | None = None,
 ) -> dict[str, Any]:
     """Execute a raw CLI command on target network devices using Netmiko."""
-    return await _run_tool(
-        NetmikoRunner,
-        "run_command",
+    return await _run_command(
         host_name,
         group_name,
-        {"backend": Backend.NETMIKO, "commands": command},
+        dict(_NETMIKO_META, commands=command),
         command,
     )
 
@@ -110,12 +227,10 @@ async def run_shell_command(
         group_name: Specific group to target.
 
     """
-    return await _run_tool(
-        ParamikoRunner,
-        "run_ssh_command",
+    return await _run_ssh_command(
         host_name,
         group_name,
-        {"backend": Backend.PARAMIKO, "shell_command": command},
+        dict(_SHELL_META, shell_command=command),
         command,
     )
 
@@ -135,19 +250,10 @@ async def upload_file(
         group_name: Specific group to target.
 
     """
-    return await _run_tool(
-        ParamikoRunner,
-        "sftp_upload",
+    return await _sftp_upload(
         host_name,
         group_name,
-        {
-            "backend": Backend.PARAMIKO,
-            "operation": "upload",
-            "type": "file",
-            "protocol": "sftp",
-            "local_path": local_path,
-            "remote_path": remote_path,
-        },
+        dict(_UPLOAD_FILE_META, local_path=local_path, remote_path=remote_path),
         local_path,
         remote_path,
     )
@@ -168,19 +274,10 @@ async def upload_directory(
         group_name: Specific group to target.
 
     """
-    return await _run_tool(
-        ParamikoRunner,
-        "scp_upload_recursive",
+    return await _scp_upload_recursive(
         host_name,
         group_name,
-        {
-            "backend": Backend.PARAMIKO,
-            "operation": "upload",
-            "type": "directory",
-            "protocol": "scp",
-            "local_path": local_path,
-            "remote_path": remote_path,
-        },
+        dict(_UPLOAD_DIRECTORY_META, local_path=local_path, remote_path=remote_path),
         local_path,
         remote_path,
     )
@@ -201,19 +298,10 @@ async def download_file(
         group_name: Specific group to target.
 
     """
-    return await _run_tool(
-        ParamikoRunner,
-        "sftp_download",
+    return await _sftp_download(
         host_name,
         group_name,
-        {
-            "backend": Backend.PARAMIKO,
-            "operation": "download",
-            "type": "file",
-            "protocol": "sftp",
-            "remote_path": remote_path,
-            "local_path": local_path,
-        },
+        dict(_DOWNLOAD_FILE_META, remote_path=remote_path, local_path=local_path),
         remote_path,
         local_path,
     )
@@ -234,19 +322,10 @@ async def download_directory(
         group_name: Specific group to target.
 
     """
-    return await _run_tool(
-        ParamikoRunner,
-        "scp_download_recursive",
+    return await _scp_download_recursive(
         host_name,
         group_name,
-        {
-            "backend": Backend.PARAMIKO,
-            "operation": "download",
-            "type": "directory",
-            "protocol": "scp",
-            "remote_path": remote_path,
-            "local_path": local_path,
-        },
+        dict(_DOWNLOAD_DIRECTORY_META, remote_path=remote_path, local_path=local_path),
         remote_path,
         local_path,
     )
@@ -254,13 +333,15 @@ async def download_directory(
 
 def list_nornir_inventory() -> dict[str, Any]:
     """List all configured network hosts and groups."""
+    # get_inventory memoizes the summary per Nornir instance, so this needs no thread dispatch
     return get_inventory()
 
 
 async def reload_nornir_inventory() -> dict[str, str]:
     """Reload the Nornir inventory from disk."""
     try:
-        await asyncio.to_thread(reset_nornir)
+        await _to_thread(reset_nornir)
+        clear_cache()
         return {"status": "success", "message": "Inventory reloaded successfully"}
     except Exception as e:
         return error_response(ErrorType.RELOAD_FAILED, str(e))
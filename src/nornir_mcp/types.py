@@ -10,6 +10,10 @@ from typing_extensions import TypedDict
 
 from .constants import ErrorType
 
+# Upper bound on error message length, so device output carried by an exception
+# (e.g. a failed Nornir subtask) cannot bloat tool responses
+MAX_ERROR_MESSAGE_LENGTH = 2048
+
 
 class MCPException(Exception):
     """Custom exception for MCP errors."""
@@ -24,7 +28,12 @@ class MCPException(Exception):
         """
         self.error_type = error_type
         self.message = message
-        super().__init__(f"{error_type}: {message}")
+        # Keep the raw arguments; the combined text is only built if the exception is printed
+        super().__init__(error_type, message)
+
+    def __str__(self) -> str:
+        """Return the error type and message as a single line."""
+        return f"{self.error_type}: {self.message}"
 
 
 class MCPError(TypedDict):
@@ -77,4 +86,19 @@ def error_response(error_type: ErrorType | str, message: str) -> dict[str, str]:
     """
     # Convert to string (works with StrEnum, str, or other types)
     error_str = str(error_type)
-    return {"error": error_str, "message": message}
+    return {"error": error_str, "message": truncate_message(message)}
+
+
+def truncate_message(message: str) -> str:
+    """Cap an error message at MAX_ERROR_MESSAGE_LENGTH characters.
+
+    Args:
+        message: Error message, possibly embedding large device output
+
+    Returns:
+        The message unchanged if short enough, otherwise its truncated prefix
+
+    """
+    if len(message) <= MAX_ERROR_MESSAGE_LENGTH:
+        return message
+    return f"{message[:MAX_ERROR_MESSAGE_LENGTH]}... [truncated]"
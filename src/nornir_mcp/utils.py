@@ -5,4 +5,9 @@ to reduce code duplication and improve maintainability.
 """
 
 # Import functions from helpers module to maintain backward compatibility
-from .helpers import format_target, validate_target_params, extract_single_key
+from .helpers import (
+    extract_single_key,
+    format_target,
+    validate_target_params,
+    validate_target_params_or_raise,
+)
@@ -4,18 +4,78 @@ This module contains pytest fixtures and configuration used across
 all test modules in the test suite.
 """
 
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
-from nornir.core import Nornir
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, MultiResult, Result
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop, which has cheaper loop start-up and task dispatch.
+
+        Returns:
+            Mapping of loop factory names to event loop factories
+
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def _shared_nornir():
+    """Build the Nornir mock once per session.
+
+    The instance is shared and reset between tests instead of rebuilt.
+
+    Returns:
+        MagicMock: A mock object that behaves like a Nornir instance
+
+    """
+    # No spec: no test relies on attribute checking, and a spec makes every mock
+    # introspect all attributes of the Nornir class
+    return MagicMock()
 
 
 @pytest.fixture
-def mock_nornir():
+def mock_nornir(_shared_nornir):
     """Provide a mock Nornir instance for testing.
 
     Returns:
         MagicMock: A mock object that behaves like a Nornir instance
 
     """
-    return MagicMock(spec=Nornir)
+    nornir = _shared_nornir
+    nornir.reset_mock(return_value=True, side_effect=True)
+    # reset_mock leaves assigned attributes alone, so restore the ones tests replace
+    nornir.runner = MagicMock()
+    nornir.inventory = MagicMock(hosts={})
+    return nornir
+
+
+@pytest.fixture(scope="session")
+def make_aggregated_result() -> Callable[[dict[str, Any]], AggregatedResult]:
+    """Provide a builder for successful Nornir run results.
+
+    Returns:
+        Callable mapping host names to task results onto an AggregatedResult
+        holding one successful Result per host
+
+    """
+
+    def build(results: dict[str, Any]) -> AggregatedResult:
+        aggregated = AggregatedResult("test_task")
+        for name, result in results.items():
+            multi_result = MultiResult("test_task")
+            multi_result.append(Result(host=Host(name), result=result))
+            aggregated[name] = multi_result
+        return aggregated
+
+    return build
@@ -8,7 +8,11 @@ from unittest.mock import MagicMock
 
 import pytest
 from nornir.core import Nornir
+from nornir.core.inventory import Group, Groups, Host, Hosts, Inventory, ParentGroups
+from nornir.core.task import Result, Task
+from nornir.plugins.runners import ThreadedRunner
 
+from nornir_mcp.connection_pool import ConnectionPool
 from nornir_mcp.constants import ErrorType
 from nornir_mcp.runners.base_runner import BaseRunner
 from nornir_mcp.types import MCPException
@@ -25,21 +29,98 @@ def test_base_runner_instantiation():
     assert isinstance(runner, BaseRunner)
 
 
-def test_process_results_no_hosts(mock_nornir):
+def test_process_results_no_hosts():
     """Test process_results method when no hosts are found.
 
     Verifies that the process_results method properly raises an
     MCPException when no hosts are found for the given target.
+    """
+    # The empty-result check never touches the Nornir instance, so no mock is needed
+    runner = TestRunner(object())
+
+    with pytest.raises(MCPException) as exc_info:
+        runner.process_results({})
+
+    assert exc_info.value.error_type == ErrorType.NO_HOSTS  # Compare to string value, not enum
+    assert exc_info.value.message == "No hosts found for the given target."
+
+
+def test_run_on_hosts_sizes_threaded_runner(mock_nornir):
+    """Test that run_on_hosts sizes the threaded runner to the number of target hosts.
 
     Args:
         mock_nornir: Mocked Nornir instance for testing
 
     """
+    mock_nornir.runner = ThreadedRunner(num_workers=20)
+    mock_nornir.inventory.hosts = {"device1": Host("device1"), "device2": Host("device2")}
     runner = TestRunner(mock_nornir)
-    # Now process_results raises an exception instead of returning a Result
 
-    with pytest.raises(MCPException) as exc_info:
-        runner.process_results({})
+    runner.run_on_hosts(task=MagicMock())
 
-    assert exc_info.value.error_type == ErrorType.NO_HOSTS  # Compare to string value, not enum
-    assert exc_info.value.message == "No hosts found for the given target."
+    mock_nornir.with_runner.assert_called_once()
+    assert mock_nornir.with_runner.call_args.args[0].num_workers == len(mock_nornir.inventory.hosts)
+    mock_nornir.with_runner.return_value.run.assert_called_once()
+
+
+def test_run_on_hosts_keeps_smaller_configured_runner(mock_nornir):
+    """Test that run_on_hosts never grows a runner configured with fewer workers.
+
+    Args:
+        mock_nornir: Mocked Nornir instance for testing
+
+    """
+    mock_nornir.runner = ThreadedRunner(num_workers=1)
+    mock_nornir.inventory.hosts = {"device1": Host("device1"), "device2": Host("device2")}
+    runner = TestRunner(mock_nornir)
+
+    runner.run_on_hosts(task=MagicMock())
+
+    mock_nornir.with_runner.assert_not_called()
+    mock_nornir.run.assert_called_once()
+
+
+def test_filter_hosts_by_name():
+    """Test that filtering by host name narrows a copy of the inventory to that host."""
+    hosts = Hosts({"device1": Host("device1"), "device2": Host("device2")})
+    nornir_instance = Nornir(inventory=Inventory(hosts=hosts))
+    runner = TestRunner(nornir_instance)
+
+    assert list(runner.filter_hosts(host_name="device1").inventory.hosts) == ["device1"]
+    assert list(runner.filter_hosts(host_name="missing").inventory.hosts) == []
+    assert list(nornir_instance.inventory.hosts) == ["device1", "device2"]
+
+
+def test_filter_hosts_by_group():
+    """Test that filtering by group returns only the direct members of that group."""
+    core = Group("core")
+    hosts = Hosts({"device1": Host("device1", groups=ParentGroups([core])), "device2": Host("device2")})
+    nornir_instance = Nornir(inventory=Inventory(hosts=hosts, groups=Groups({"core": core})))
+    runner = TestRunner(nornir_instance)
+
+    assert list(runner.filter_hosts(group_name="core").inventory.hosts) == ["device1"]
+    assert list(runner.filter_hosts(group_name="missing").inventory.hosts) == []
+    assert list(nornir_instance.inventory.hosts) == ["device1", "device2"]
+
+
+def test_run_on_hosts_drops_connections_of_hosts_reporting_errors(monkeypatch):
+    """Test that a host whose task returns an error dict does not keep its session pooled."""
+    pool = ConnectionPool(idle_ttl=600)
+    monkeypatch.setattr("nornir_mcp.runners.base_runner.get_connection_pool", lambda: pool)
+    hosts = Hosts({"device1": Host("device1"), "device2": Host("device2")})
+    for host in hosts.values():
+        host.connections["paramiko"] = MagicMock()
+    broken = hosts["device1"].connections["paramiko"]
+    runner = TestRunner(Nornir(inventory=Inventory(hosts=hosts), runner=ThreadedRunner()))
+
+    def task(task: Task) -> Result:
+        if task.host.name == "device1":
+            return Result(host=task.host, result={"error": ErrorType.EXECUTION_ERROR, "success": False})
+        return Result(host=task.host, result={"success": True})
+
+    runner.run_on_hosts(task=task)
+
+    assert "paramiko" not in hosts["device1"].connections
+    broken.close.assert_called_once()
+    assert "paramiko" in hosts["device2"].connections
+    pool.close_all()
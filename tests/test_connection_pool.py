@@ -0,0 +1,210 @@
+"""Tests for the connection pool module.
+
+This module contains unit tests for the ConnectionPool class, verifying
+that connections are kept between runs, evicted when idle, closed when
+pooling is disabled or their host failed, and leased exclusively.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from nornir.core.inventory import Host
+
+from nornir_mcp import connection_pool
+from nornir_mcp.connection_pool import ConnectionPool, get_connection_pool
+from nornir_mcp.constants import DefaultValue, EnvVar, ErrorType
+from nornir_mcp.types import MCPException
+
+
+def make_nornir(*hosts: Host) -> MagicMock:
+    """Build a mock Nornir object whose inventory holds the given hosts."""
+    nornir = MagicMock()
+    nornir.inventory.hosts = {host.name: host for host in hosts}
+    return nornir
+
+
+def make_host(name: str) -> Host:
+    """Build an inventory host with an open mock Netmiko connection."""
+    host = Host(name=name, hostname=f"{name}.example.net", username="admin", port=22)
+    host.connections["netmiko"] = MagicMock()
+    return host
+
+
+def test_lease_keeps_connections_open():
+    """Test that connections survive the end of a run when pooling is enabled."""
+    pool = ConnectionPool(idle_ttl=600)
+    host = make_host("router1")
+    connection = host.connections["netmiko"]
+
+    with pool.lease(make_nornir(host)):
+        pass
+
+    assert "netmiko" in host.connections
+    connection.close.assert_not_called()
+    pool.close_all()
+
+
+def test_evict_idle_closes_expired_connections():
+    """Test that connections idle for longer than the TTL are closed."""
+    pool = ConnectionPool(idle_ttl=0)
+    host = make_host("router1")
+    connection = host.connections["netmiko"]
+
+    with patch.object(pool, "_schedule"), pool.lease(make_nornir(host)):
+        pass
+
+    assert pool.evict_idle() == 1
+    assert "netmiko" not in host.connections
+    connection.close.assert_called_once()
+
+
+def test_evict_idle_skips_leased_hosts():
+    """Test that a connection is not evicted while its host is part of a run."""
+    pool = ConnectionPool(idle_ttl=0)
+    host = make_host("router1")
+    nornir = make_nornir(host)
+
+    with patch.object(pool, "_schedule"):
+        with pool.lease(nornir):
+            pass
+        with pool.lease(nornir):
+            assert pool.evict_idle() == 0
+            assert "netmiko" in host.connections
+
+
+def test_disabled_pool_closes_after_run():
+    """Test that connections are closed as soon as a run finishes when pooling is disabled."""
+    pool = ConnectionPool(idle_ttl=600, enabled=False)
+    host = make_host("router1")
+    connection = host.connections["netmiko"]
+
+    with pool.lease(make_nornir(host)):
+        pass
+
+    assert "netmiko" not in host.connections
+    connection.close.assert_called_once()
+
+
+def test_evict_idle_recycles_old_connections():
+    """Test that connections older than the max age are closed even if recently used."""
+    pool = ConnectionPool(idle_ttl=600, max_age=0)
+    host = make_host("router1")
+    connection = host.connections["netmiko"]
+
+    with patch.object(pool, "_schedule"), pool.lease(make_nornir(host)):
+        pass
+
+    assert pool.evict_idle() == 1
+    connection.close.assert_called_once()
+
+
+def test_max_size_closes_least_recently_used():
+    """Test that the least recently used connection is closed when the pool is full."""
+    pool = ConnectionPool(idle_ttl=600, max_size=1)
+    first, second = make_host("router1"), make_host("router2")
+    first_connection = first.connections["netmiko"]
+
+    with pool.lease(make_nornir(first)):
+        pass
+    with pool.lease(make_nornir(second)):
+        pass
+
+    assert "netmiko" not in first.connections
+    first_connection.close.assert_called_once()
+    assert "netmiko" in second.connections
+    pool.close_all()
+
+
+def test_max_size_evicts_ties_with_unset_credentials():
+    """Test that connections used at the same moment are evicted even when their keys hold None."""
+    pool = ConnectionPool(idle_ttl=600, max_size=1)
+    unset = Host(name="router1", hostname="router1.example.net")
+    unset.connections["netmiko"] = MagicMock()
+    configured = make_host("router2")
+    nornir = make_nornir(unset, configured)
+
+    with patch.object(connection_pool.time, "monotonic", return_value=0.0):
+        with pool.lease(nornir):
+            pass
+        # The first lease was released, so the same devices can be leased again
+        with pool.lease(nornir):
+            pass
+
+    assert len(unset.connections) + len(configured.connections) == 1
+    pool.close_all()
+
+
+def test_lease_is_exclusive_per_endpoint():
+    """Test that a second run on the same device waits for the first to finish."""
+    pool = ConnectionPool(idle_ttl=600)
+    nornir = make_nornir(make_host("router1"))
+    second_leased = threading.Event()
+
+    def second_run():
+        with pool.lease(nornir):
+            second_leased.set()
+
+    with pool.lease(nornir):
+        thread = threading.Thread(target=second_run)
+        thread.start()
+        assert not second_leased.wait(timeout=0.1)
+    thread.join(timeout=5)
+
+    assert second_leased.is_set()
+    pool.close_all()
+
+
+def test_lease_times_out_on_busy_hosts():
+    """Test that a run gives up with a host busy error when its devices stay leased."""
+    pool = ConnectionPool(idle_ttl=600, lease_timeout=0.05)
+    busy, free = make_host("router1"), make_host("router2")
+
+    with pool.lease(make_nornir(busy)):
+        with pytest.raises(MCPException) as exc_info, pool.lease(make_nornir(busy, free)):
+            pass
+
+    assert exc_info.value.error_type == ErrorType.HOSTS_BUSY
+    assert exc_info.value.message.endswith(": router1")
+    # The timed-out run reserved nothing, so the free device can still be leased
+    with pool.lease(make_nornir(free)):
+        pass
+    pool.close_all()
+
+
+def test_failed_host_connections_are_closed():
+    """Test that connections of hosts whose task failed are not returned to the pool."""
+    pool = ConnectionPool(idle_ttl=600)
+    failed, healthy = make_host("router1"), make_host("router2")
+    failed_connection = failed.connections["netmiko"]
+
+    with pool.lease(make_nornir(failed, healthy)) as failed_hosts:
+        failed_hosts.add("router1")
+
+    assert "netmiko" not in failed.connections
+    failed_connection.close.assert_called_once()
+    assert "netmiko" in healthy.connections
+    pool.close_all()
+
+
+def test_connections_close_outside_lock():
+    """Test that sessions are closed after the pool lock is released."""
+    pool = ConnectionPool(idle_ttl=0)
+    host = make_host("router1")
+    connection = host.connections["netmiko"]
+    lock_held = []
+    connection.close.side_effect = lambda: lock_held.append(pool._lock._is_owned())
+
+    with patch.object(pool, "_schedule"), pool.lease(make_nornir(host)):
+        pass
+    pool.evict_idle()
+
+    assert lock_held == [False]
+
+
+def test_invalid_pool_setting_falls_back_to_default(monkeypatch):
+    """Test that a non-numeric environment value does not break pool creation."""
+    monkeypatch.setenv(EnvVar.POOL_IDLE_TTL, "ten minutes")
+    monkeypatch.setattr(connection_pool, "_POOL", None)
+
+    assert get_connection_pool().idle_ttl == float(DefaultValue.POOL_IDLE_TTL)
@@ -0,0 +1,106 @@
+"""Tests for the helpers module.
+
+This module contains unit tests for the shared helper functions used by the
+tools and runners.
+"""
+
+import datetime
+import json
+from collections import OrderedDict
+
+import pytest
+
+from nornir_mcp import helpers
+from nornir_mcp.helpers import (
+    _json_default,
+    extract_single_key,
+    format_target,
+    serialize_result,
+    validate_target_params,
+    validate_target_params_or_raise,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (b"\xfb\xff", "+/8="),
+        (bytearray(b"ok"), "b2s="),
+        (datetime.date(2024, 1, 2), "2024-01-02"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5), "2024-01-02T03:04:05"),
+        (ValueError("boom"), "boom"),
+    ],
+)
+def test_json_default(value, expected):
+    """Test that values JSON cannot represent are converted to text."""
+    assert _json_default(value) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize_result(monkeypatch, use_orjson):
+    """Test that both serializer paths produce the same compact JSON."""
+    if not use_orjson:
+        monkeypatch.setattr(helpers, "orjson", None)
+    elif helpers.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    data = {"r1": {"uptime": 10, "raw": b"ok", "seen": datetime.date(2024, 1, 2)}}
+    text = serialize_result(data)
+
+    assert " " not in text
+    assert json.loads(text) == {"r1": {"uptime": 10, "raw": "b2s=", "seen": "2024-01-02"}}
+
+
+@pytest.mark.parametrize(
+    ("host_name", "group_name"),
+    [("host1", None), (None, "group1"), (None, None)],
+)
+def test_validate_target_params_accepts_single_target(host_name, group_name):
+    """Test that a single target, or none at all, is valid."""
+    assert validate_target_params(host_name, group_name) is None
+
+
+def test_validate_target_params_rejects_host_and_group():
+    """Test that targeting a host and a group at once returns an error message."""
+    assert validate_target_params("host1", "group1") == "Cannot specify both host_name and group_name"
+
+
+def test_validate_target_params_or_raise():
+    """Test that the raising variant accepts a single target and raises ValueError for both."""
+    validate_target_params_or_raise("host1", None)
+
+    with pytest.raises(ValueError, match="Cannot specify both host_name and group_name"):
+        validate_target_params_or_raise("host1", "group1")
+
+
+def test_format_target_reuses_group_string():
+    """Test that repeated group targets are served from the cache as one string object."""
+    format_target.cache_clear()
+
+    first = format_target(None, "core")
+    second = format_target(None, "core")
+
+    assert first == "group:core"
+    assert second is first
+    assert format_target.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"facts": {"vendor": "Cisco"}}, {"vendor": "Cisco"}),
+        (OrderedDict(facts={"vendor": "Cisco"}), {"vendor": "Cisco"}),
+        ({"facts": None}, None),
+        ({"facts": {}}, {}),
+    ],
+    ids=["dict", "dict-subclass", "none-value", "falsy-value"],
+)
+def test_extract_single_key_returns_value(data, expected):
+    """Test that a present key is extracted, even from dict subclasses or when its value is falsy."""
+    assert extract_single_key(data, "facts") == expected
+
+
+@pytest.mark.parametrize("data", [{"interfaces": {}}, ["facts"], "facts"], ids=["missing-key", "list", "str"])
+def test_extract_single_key_returns_data_unchanged(data):
+    """Test that data without the key, or that is not a dict, is returned as is."""
+    assert extract_single_key(data, "facts") is data
@@ -4,14 +4,14 @@ This module contains unit tests for the NapalmRunner class and its methods,
 verifying that NAPALM-based network operations work correctly.
 """
 
+from collections import OrderedDict
 from unittest.mock import MagicMock, patch
 
-from nornir.core.task import AggregatedResult, MultiResult, Result
+from nornir_mcp.constants import ErrorType
+from nornir_mcp.runners.napalm_runner import NapalmRunner, get_supported_getters
 
-from nornir_mcp.runners.napalm_runner import NapalmRunner
 
-
-def test_run_getter_success(mock_nornir):
+def test_run_getter_success(mock_nornir, make_aggregated_result):
     """Test successful execution of a NAPALM getter operation.
 
     Verifies that the run_getter method properly executes and returns
@@ -19,21 +19,11 @@ def test_run_getter_success(mock_nornir):
 
     Args:
         mock_nornir: Mocked Nornir instance for testing
+        make_aggregated_result: Builder for Nornir run results
 
     """
     runner = NapalmRunner(mock_nornir)
-
-    # Mock Nornir run result
-    mock_result = MagicMock(spec=AggregatedResult)
-    mock_result.__getitem__.return_value = MultiResult("test_task")  # Satisfy type hints if needed
-    mock_result.__iter__.return_value = iter(["device1"])
-    mock_result.__len__.return_value = 1
-
-    mock_multi_result = MultiResult("test_task")
-    mock_task_result = Result(host=MagicMock(), result={"facts": "some_facts"})
-    mock_multi_result.append(mock_task_result)
-
-    mock_result.items.return_value = [("device1", mock_multi_result)]
+    mock_result = make_aggregated_result({"device1": {"facts": "some_facts"}})
 
     with patch.object(runner, "run_on_hosts", return_value=mock_result):
         result = runner.run_getter("facts", "device1")
@@ -42,7 +32,7 @@ def test_run_getter_success(mock_nornir):
         assert result == {"device1": "some_facts"}
 
 
-def test_run_getter_extraction(mock_nornir):
+def test_run_getter_extraction(mock_nornir, make_aggregated_result):
     """Test NAPALM getter result extraction functionality.
 
     Verifies that the run_getter method properly extracts only the requested
@@ -50,19 +40,12 @@ def test_run_getter_extraction(mock_nornir):
 
     Args:
         mock_nornir: Mocked Nornir instance for testing
+        make_aggregated_result: Builder for Nornir run results
 
     """
     runner = NapalmRunner(mock_nornir)
-
-    mock_result = MagicMock(spec=AggregatedResult)
-    mock_result.__len__.return_value = 1
-
-    mock_multi_result = MultiResult("test_task")
     # Result contains more than just the getter
-    mock_task_result = Result(host=MagicMock(), result={"facts": "target", "other": "ignored"})
-    mock_multi_result.append(mock_task_result)
-
-    mock_result.items.return_value = [("device1", mock_multi_result)]
+    mock_result = make_aggregated_result({"device1": {"facts": "target", "other": "ignored"}})
 
     with patch.object(runner, "run_on_hosts", return_value=mock_result):
         # We asked for 'facts', so we should only get 'target'
@@ -70,3 +53,59 @@ def test_run_getter_extraction(mock_nornir):
         # The result is now a plain dict instead of a Success object
         assert isinstance(result, dict)
         assert result == {"device1": "target"}
+
+
+def test_run_getter_extracts_from_dict_subclass(mock_nornir, make_aggregated_result):
+    """Test that getter data is extracted when a plugin returns a dict subclass.
+
+    Args:
+        mock_nornir: Mocked Nornir instance for testing
+        make_aggregated_result: Builder for Nornir run results
+
+    """
+    runner = NapalmRunner(mock_nornir)
+    mock_result = make_aggregated_result({"device1": OrderedDict(facts="target", other="ignored")})
+
+    with patch.object(runner, "run_on_hosts", return_value=mock_result):
+        result = runner.run_getter("facts")
+
+    assert result == {"device1": "target"}
+
+
+def test_run_getters_batches_into_one_run(mock_nornir, make_aggregated_result):
+    """Test that multiple getters are collected in a single napalm_get run.
+
+    Verifies that run_getters passes every getter to one run and returns
+    the full per-getter dictionary for each host.
+
+    Args:
+        mock_nornir: Mocked Nornir instance for testing
+        make_aggregated_result: Builder for Nornir run results
+
+    """
+    runner = NapalmRunner(mock_nornir)
+    mock_result = make_aggregated_result({"device1": {"facts": "f", "interfaces": "i"}})
+
+    with patch.object(runner, "run_on_hosts", return_value=mock_result) as mock_run_on_hosts:
+        result = runner.run_getters(["facts", "interfaces"], "device1")
+
+    assert result == {"device1": {"facts": "f", "interfaces": "i"}}
+    mock_run_on_hosts.assert_called_once()
+    assert mock_run_on_hosts.call_args.kwargs["getters"] == ["facts", "interfaces"]
+
+
+def test_get_supported_getters_reports_unsupported():
+    """Test that an unimplemented getter is reported without failing the others.
+
+    Verifies that get_supported_getters returns the data of implemented
+    getters and an unsupported_getter error for the rest.
+    """
+    task = MagicMock()
+    device = task.host.get_connection.return_value
+    device.get_facts.return_value = {"hostname": "device1"}
+    device.get_bgp_neighbors.side_effect = NotImplementedError
+
+    result = get_supported_getters(task, ["facts", "bgp_neighbors"])
+
+    assert result.result["facts"] == {"hostname": "device1"}
+    assert result.result["bgp_neighbors"]["error"] == ErrorType.UNSUPPORTED_GETTER
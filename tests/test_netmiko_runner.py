@@ -4,11 +4,16 @@ This module contains unit tests for the NetmikoRunner class and its methods,
 verifying that Netmiko-based network operations work correctly.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, MultiResult, Result
 
-from nornir_mcp.runners.netmiko_runner import NetmikoRunner
+from nornir_mcp.runners.netmiko_runner import NetmikoRunner, send_command_task
+
+# Never raised, only carried by failed task results, so one instance can be shared
+_CONNECTION_ERROR = Exception("Connection error")
 
 
 @pytest.fixture
@@ -25,7 +30,7 @@ def runner(mock_nornir):
     return NetmikoRunner(mock_nornir)
 
 
-def test_run_command_success(runner, mock_nornir):
+def test_run_command_success(runner, mock_nornir, make_aggregated_result):
     """Test successful execution of a Netmiko command operation.
 
     Verifies that the run_command method properly executes and returns
@@ -34,36 +39,19 @@ def test_run_command_success(runner, mock_nornir):
     Args:
         runner: NetmikoRunner instance for testing
         mock_nornir: Mocked Nornir instance for testing
+        make_aggregated_result: Builder for Nornir run results
 
     """
-    # Mock the Nornir run result
-    mock_agg_result = MagicMock()
-    # Behave like a dictionary
-    mock_agg_result.items.return_value = []
-    # But when we iterate, we want it to behave like the real thing
-
-    # Mocking AggregatedResult is tricky because it acts as dict and boolean.
-    # BaseRunner.process_results checks 'if not result:' first.
-    # So we need __bool__ to return True.
-    mock_agg_result.__bool__.return_value = True
-
-    mock_task_result = MagicMock()
-    mock_task_result.failed = False
-    mock_task_result.result = "command output"
-
-    mock_agg_result.items.return_value = [("host1", [mock_task_result])]
-    mock_nornir.run.return_value = mock_agg_result
+    mock_nornir.run.return_value = make_aggregated_result({"host1": "command output"})
 
     result = runner.run_command("show version")
 
     # The result is now a plain dict instead of a Success object
     assert isinstance(result, dict)
     assert result == {"host1": "command output"}
-    mock_nornir.run.assert_called_once()
-
     # Check arguments passed to run
-    call_kwargs = mock_nornir.run.call_args[1]
-    assert call_kwargs["command_string"] == "show version"
+    mock_nornir.run.assert_called_once()
+    assert mock_nornir.run.call_args.kwargs["command_string"] == "show version"
 
 
 def test_run_command_failure(runner, mock_nornir):
@@ -77,16 +65,10 @@ def test_run_command_failure(runner, mock_nornir):
         mock_nornir: Mocked Nornir instance for testing
 
     """
-    # Mock the Nornir run result failure
-    mock_agg_result = MagicMock()
-    mock_agg_result.__bool__.return_value = True
-
-    mock_task_result = MagicMock()
-    mock_task_result.failed = True
-    mock_task_result.exception = Exception("Connection error")
-
-    mock_agg_result.items.return_value = [("host1", [mock_task_result])]
-    mock_nornir.run.return_value = mock_agg_result
+    failed_task = MultiResult("send_command_task")
+    failed_task.append(Result(host=Host("host1"), failed=True, exception=_CONNECTION_ERROR))
+    mock_nornir.run.return_value = AggregatedResult("send_command_task")
+    mock_nornir.run.return_value["host1"] = failed_task
 
     result = runner.run_command("show version")
 
@@ -97,7 +79,7 @@ def test_run_command_failure(runner, mock_nornir):
     assert "Connection error" in result["host1"]["message"]
 
 
-def test_run_command_kwargs(runner, mock_nornir):
+def test_run_command_kwargs(runner, mock_nornir, make_aggregated_result):
     """Test Netmiko command operation with additional keyword arguments.
 
     Verifies that the run_command method properly passes additional
@@ -106,17 +88,31 @@ def test_run_command_kwargs(runner, mock_nornir):
     Args:
         runner: NetmikoRunner instance for testing
         mock_nornir: Mocked Nornir instance for testing
+        make_aggregated_result: Builder for Nornir run results
 
     """
-    mock_agg_result = MagicMock()
-    mock_agg_result.__bool__.return_value = True
-    mock_task_result = MagicMock()
-    mock_task_result.failed = False
-    mock_task_result.result = "output"
-    mock_agg_result.items.return_value = [("host1", [mock_task_result])]
-    mock_nornir.run.return_value = mock_agg_result
+    mock_nornir.run.return_value = make_aggregated_result({"host1": "output"})
 
     runner.run_command("show version", enable=True)
 
-    call_kwargs = mock_nornir.run.call_args[1]
-    assert call_kwargs["enable"] is True
+    assert mock_nornir.run.call_args.kwargs["enable"] is True
+
+
+def test_send_command_task_tunes_ssh_transport():
+    """Test that the Netmiko task tunes the SSH transport before sending.
+
+    Verifies that send_command_task applies keepalive/TCP tuning to the
+    host's Paramiko transport and then delegates to netmiko_send_command.
+    """
+    task = MagicMock()
+    connection = task.host.get_connection.return_value
+
+    with (
+        patch("nornir_mcp.runners.netmiko_runner.tune_ssh_transport") as mock_tune,
+        patch("nornir_netmiko.tasks.netmiko_send_command") as mock_send,
+    ):
+        result = send_command_task(task, command_string="show version")
+
+    mock_tune.assert_called_once_with(connection.remote_conn.get_transport.return_value)
+    mock_send.assert_called_once_with(task, command_string="show version")
+    assert result is mock_send.return_value
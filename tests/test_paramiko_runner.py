@@ -1,10 +1,13 @@
 """Tests for the Paramiko runner module.
 
 This module contains unit tests for the ParamikoRunner class and its methods,
-verifying that error handling works correctly.
+verifying error handling and the tar-over-SSH directory upload.
 """
 
-from unittest.mock import Mock
+import io
+import shlex
+import tarfile
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -12,92 +15,175 @@ from nornir_mcp.constants import ErrorType
 from nornir_mcp.runners.paramiko_runner import ParamikoRunner
 from nornir_mcp.types import MCPException
 
+COMMAND_REQUIRED = "Command parameter is required"
+LOCAL_PATH_REQUIRED = "Local path parameter is required"
+REMOTE_PATH_REQUIRED = "Remote path parameter is required"
+
+
+class _RemoteStdin(io.BytesIO):
+    """Stand-in for the remote tar's stdin that keeps what was written after close."""
+
+    def close(self):
+        self.written = self.getvalue()
+        super().close()
+
+
+class _ClosedRemoteStdin(_RemoteStdin):
+    """Stand-in for the stdin of a remote command that exited before reading it."""
+
+    def write(self, data):
+        raise OSError("Socket is closed")
+
+
+def run_upload_task(local_path, remote_path, exit_status=0, stderr=b"", stdin_cls=_RemoteStdin):
+    """Run the per-host task of scp_upload_recursive against a fake SSH channel.
+
+    Args:
+        local_path: Local directory to upload
+        remote_path: Remote destination directory
+        exit_status: Exit status reported by the remote tar
+        stderr: Standard error output of the remote tar
+        stdin_cls: Class of the fake remote stdin the archive is written to
+
+    Returns:
+        Tuple of (task result, fake channel, captured remote stdin)
+
+    """
+    runner = ParamikoRunner(Mock())
+    with patch.object(runner, "run_on_hosts") as run_on_hosts, patch.object(runner, "process_results"):
+        runner.scp_upload_recursive(local_path, remote_path, host_name="server1")
+    upload_task = run_on_hosts.call_args.kwargs["task"]
+
+    channel = MagicMock()
+    channel.recv_exit_status.return_value = exit_status
+    channel.makefile_stderr.return_value = io.BytesIO(stderr)
+    channel.makefile.return_value = remote_stdin = stdin_cls()
+    task = MagicMock()
+    task.host.name = "server1"
+    transport = task.host.get_connection.return_value.get_transport.return_value
+    transport.open_session.return_value.__enter__.return_value = channel
+
+    return upload_task(task), channel, remote_stdin
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Create a ParamikoRunner shared by the tests in this module.
+
+    Every test fails input validation before the Nornir instance is used,
+    so a single runner can safely be reused.
+
+    Returns:
+        ParamikoRunner: A runner instance for testing
+
+    """
+    return ParamikoRunner(Mock())
+
 
 class TestParamikoRunner:
     """Test suite for ParamikoRunner class."""
 
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.mock_nornir = Mock()
-        self.runner = ParamikoRunner(self.mock_nornir)
-
-    def test_run_ssh_command_empty_command(self):
+    def test_run_ssh_command_empty_command(self, runner):
         """Test SSH command execution with empty command."""
         with pytest.raises(MCPException) as exc_info:
-            self.runner.run_ssh_command("", host_name="test-host")
+            runner.run_ssh_command("", host_name="test-host")
 
         assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Command parameter is required" in exc_info.value.message
-
-    def test_sftp_upload_empty_paths(self):
-        """Test SFTP upload with empty paths."""
+        assert COMMAND_REQUIRED in exc_info.value.message
+
+    @pytest.mark.parametrize(
+        ("method", "args", "expected_message"),
+        [
+            ("sftp_upload", ("", "/remote/path.txt"), LOCAL_PATH_REQUIRED),
+            ("sftp_upload", ("/local/path.txt", ""), REMOTE_PATH_REQUIRED),
+            ("sftp_download", ("", "/local/path.txt"), REMOTE_PATH_REQUIRED),
+            ("sftp_download", ("/remote/path.txt", ""), LOCAL_PATH_REQUIRED),
+            ("scp_upload", ("", "/remote/path.txt"), LOCAL_PATH_REQUIRED),
+            ("scp_upload", ("/local/path.txt", ""), REMOTE_PATH_REQUIRED),
+            ("scp_download", ("", "/local/path.txt"), REMOTE_PATH_REQUIRED),
+            ("scp_download", ("/remote/path.txt", ""), LOCAL_PATH_REQUIRED),
+            ("scp_upload_recursive", ("", "/remote/path.txt"), LOCAL_PATH_REQUIRED),
+            ("scp_upload_recursive", ("/local/path.txt", ""), REMOTE_PATH_REQUIRED),
+        ],
+    )
+    def test_file_transfer_empty_paths(self, runner, method, args, expected_message):
+        """Test file transfer methods with an empty local or remote path."""
         with pytest.raises(MCPException) as exc_info:
-            self.runner.sftp_upload("", "/remote/path.txt", host_name="test-host")
+            getattr(runner, method)(*args, host_name="test-host")
 
         assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Local path parameter is required" in exc_info.value.message
+        assert expected_message in exc_info.value.message
 
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.sftp_upload("/local/path.txt", "", host_name="test-host")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Remote path parameter is required" in exc_info.value.message
+@pytest.mark.benchmark(group="validation")
+def test_benchmark_empty_command_rejection(benchmark, runner):
+    """Benchmark rejecting an empty SSH command, the path every invalid request takes."""
 
-    def test_sftp_download_empty_paths(self):
-        """Test SFTP download with empty paths."""
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.sftp_download("", "/local/path.txt", host_name="test-host")
+    def reject_empty_command():
+        try:
+            runner.run_ssh_command("", host_name="test-host")
+        except MCPException as e:
+            return e
+        return None
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Remote path parameter is required" in exc_info.value.message
+    error = benchmark(reject_empty_command)
+    assert error is not None
+    assert error.error_type == ErrorType.INVALID_PARAMETERS
 
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.sftp_download("/remote/path.txt", "", host_name="test-host")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Local path parameter is required" in exc_info.value.message
+def test_scp_upload_recursive_streams_tar(tmp_path):
+    """Test that a directory is streamed as a gzip tar archive into the remote tar."""
+    local_dir = tmp_path / "configs"
+    local_dir.mkdir()
+    (local_dir / "router1.cfg").write_text("hostname router1")
 
-    def test_scp_upload_empty_paths(self):
-        """Test SCP upload with empty paths."""
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.scp_upload("", "/remote/path.txt", host_name="test-host")
+    result, channel, remote_stdin = run_upload_task(str(local_dir), "/srv/backup")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Local path parameter is required" in exc_info.value.message
+    assert result["success"] is True
+    channel.exec_command.assert_called_once_with("mkdir -p /srv/backup && tar -xzf - -C /srv/backup")
+    channel.shutdown_write.assert_called_once()
+    with tarfile.open(fileobj=io.BytesIO(remote_stdin.written), mode="r:gz") as tar:
+        assert tar.extractfile("configs/router1.cfg").read() == b"hostname router1"
 
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.scp_upload("/local/path.txt", "", host_name="test-host")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Remote path parameter is required" in exc_info.value.message
+def test_scp_upload_recursive_quotes_remote_path(tmp_path):
+    """Test that remote paths with spaces and quotes reach the shell as single words."""
+    remote_path = "/srv/my backups/it's here"
 
-    def test_scp_download_empty_paths(self):
-        """Test SCP download with empty paths."""
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.scp_download("", "/local/path.txt", host_name="test-host")
+    _, channel, _ = run_upload_task(str(tmp_path), remote_path)
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Remote path parameter is required" in exc_info.value.message
+    command = channel.exec_command.call_args.args[0]
+    assert shlex.split(command) == ["mkdir", "-p", remote_path, "&&", "tar", "-xzf", "-", "-C", remote_path]
 
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.scp_download("/remote/path.txt", "", host_name="test-host")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Local path parameter is required" in exc_info.value.message
+def test_scp_upload_recursive_reports_remote_tar_failure(tmp_path):
+    """Test that a non-zero remote tar exit status is reported with its stderr."""
+    result, _, _ = run_upload_task(
+        str(tmp_path), "/readonly", exit_status=2, stderr=b"tar: /readonly: Cannot open: Permission denied\n"
+    )
 
-    def test_scp_upload_recursive_empty_paths(self):
-        """Test SCP upload recursive with empty paths."""
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.scp_upload_recursive("", "/remote/path.txt", host_name="test-host")
+    assert result["success"] is False
+    assert result["error"] == ErrorType.EXECUTION_ERROR
+    assert "remote tar exited with status 2" in result["message"]
+    assert result["message"].endswith("tar: /readonly: Cannot open: Permission denied")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Local path parameter is required" in exc_info.value.message
 
-        with pytest.raises(MCPException) as exc_info:
-            self.runner.scp_upload_recursive("/local/path.txt", "", host_name="test-host")
+def test_scp_upload_recursive_reports_early_remote_failure(tmp_path):
+    """Test that a remote failure before the archive is read is reported with its stderr."""
+    (tmp_path / "router1.cfg").write_bytes(b"hostname router1")
 
-        assert exc_info.value.error_type == ErrorType.INVALID_PARAMETERS
-        assert "Remote path parameter is required" in exc_info.value.message
+    result, channel, _ = run_upload_task(
+        str(tmp_path),
+        "/readonly",
+        exit_status=1,
+        stderr=b"mkdir: cannot create directory '/readonly': Permission denied\n",
+        stdin_cls=_ClosedRemoteStdin,
+    )
+
+    assert result["success"] is False
+    assert "remote tar exited with status 1" in result["message"]
+    assert result["message"].endswith("mkdir: cannot create directory '/readonly': Permission denied")
+    channel.shutdown_write.assert_called_once()
 
 
 def test_import():
@@ -4,88 +4,288 @@ This module contains unit tests for the MCP tool functions,
 verifying that tool execution and error handling work correctly.
 """
 
-from unittest.mock import patch
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
 
 import pytest
 
-from nornir_mcp.tools import get_device_data, run_cli_commands
+from nornir_mcp import cache, tools
+from nornir_mcp.cache import clear_cache
+from nornir_mcp.constants import Backend, ErrorType
+from nornir_mcp.runners.napalm_runner import NapalmRunner
+from nornir_mcp.runners.netmiko_runner import NetmikoRunner
+from nornir_mcp.tools import (
+    get_device_data,
+    get_device_snapshot,
+    list_nornir_inventory,
+    reload_nornir_inventory,
+    run_cli_commands,
+)
+from nornir_mcp.types import MAX_ERROR_MESSAGE_LENGTH
 
 
-@pytest.mark.asyncio
-async def test_get_device_data_success():
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    """Ensure cached tool responses never leak between tests."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@pytest.fixture
+def mock_get_nornir(monkeypatch):
+    """Patch the Nornir instance lookup used by the tools.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+
+    Returns:
+        MagicMock: The patched get_nornir
+
+    """
+    mock = MagicMock()
+    monkeypatch.setattr("nornir_mcp.tools.get_nornir", mock)
+    return mock
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_get_device_data_success(monkeypatch):
     """Test successful execution of the get_device_data tool function.
 
     Verifies that the tool function properly executes and returns
     the expected result structure when the operation succeeds.
     """
-    with (
-        patch("nornir_mcp.tools.get_nornir") as mock_get_nornir,
-        patch("nornir_mcp.tools.NapalmRunner") as MockRunner,
-    ):
-        # Mock the get_nornir function to return a mock Nornir instance
-        mock_nornir_instance = mock_get_nornir.return_value
-
-        mock_instance = MockRunner.return_value
-        # Return a plain dict instead of a Success object
-        mock_instance.run_getter.return_value = {"host1": "data"}
-
-        result = await get_device_data("facts")
-
-        assert "error" not in result
-        assert result["backend"] == "napalm"
-        assert result["data_type"] == "facts"
-        assert result["target"] == "all"
-        assert result["data"] == {"host1": "data"}
-        mock_instance.run_getter.assert_called_once_with("facts", host_name=None, group_name=None)
-        MockRunner.assert_called_once_with(mock_nornir_instance)
-
-
-@pytest.mark.asyncio
-async def test_get_device_data_invalid_params():
-    """Test invalid parameters handling in the get_device_data tool function.
-
-    Verifies that the tool function properly validates parameters and returns
-    the expected error response when invalid parameters are provided.
+    mock_run_getter = MagicMock(return_value={"host1": "data"})
+    monkeypatch.setattr(NapalmRunner, "run_getter", mock_run_getter)
+
+    result = await get_device_data("facts")
+
+    assert "error" not in result
+    assert result["backend"] == "napalm"
+    assert result["data_type"] == "facts"
+    assert result["target"] == "all"
+    assert result["data"] == {"host1": "data"}
+    mock_run_getter.assert_called_once_with("facts", host_name=None, group_name=None)
+
+
+async def test_get_device_data_coalesces_identical_calls(mock_get_nornir, monkeypatch):
+    """Test that identical concurrent getter calls share one execution.
+
+    Verifies that concurrent calls are deduplicated while in flight and that
+    a follow-up call within the TTL is served from the response cache.
     """
-    result = await get_device_data("facts", host_name="h1", group_name="g1")
+    mock_run_getter = MagicMock(return_value={"host1": "data"})
+    monkeypatch.setattr(NapalmRunner, "run_getter", mock_run_getter)
+
+    first, second = await asyncio.gather(
+        get_device_data("facts", host_name="host1"),
+        get_device_data("facts", host_name="host1"),
+    )
+    third = await get_device_data("facts", host_name="host1")
+
+    assert first == second == third
+    assert first["data"] == {"host1": "data"}
+    mock_run_getter.assert_called_once_with("facts", host_name="host1", group_name=None)
+    # The cache hit returns before the Nornir instance is even resolved
+    mock_get_nornir.assert_called_once()
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_get_device_data_caches_facts_longer(monkeypatch):
+    """Test that facts responses are cached with their own, longer TTL."""
+    facts_ttl, default_ttl = 60.0, 2.0
+    monkeypatch.setattr("nornir_mcp.tools._FACTS_CACHE_TTL", facts_ttl)
+    monkeypatch.setattr("nornir_mcp.cache._RESPONSE_TTL", default_ttl)
+    monkeypatch.setattr(NapalmRunner, "run_getter", lambda self, getter, **kwargs: {"host1": "data"})
+
+    await get_device_data("facts", host_name="host1")
+    await get_device_data("interfaces", host_name="host1")
+
+    facts_expiry, _ = cache._RESPONSES[(Backend.NAPALM, "run_getter", "facts", "host1", None)]
+    interfaces_expiry, _ = cache._RESPONSES[(Backend.NAPALM, "run_getter", "interfaces", "host1", None)]
+    assert facts_expiry - interfaces_expiry > facts_ttl - 2 * default_ttl
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_get_device_data_skips_caching_host_errors(monkeypatch):
+    """Test that a response containing a per-host error is not cached."""
+    host_error = {"error": ErrorType.EXECUTION_FAILED, "message": "timeout"}
+    mock_run_getter = MagicMock(return_value={"host1": host_error})
+    monkeypatch.setattr(NapalmRunner, "run_getter", mock_run_getter)
+
+    await get_device_data("facts", host_name="host1")
+    await get_device_data("facts", host_name="host1")
+
+    assert mock_run_getter.call_count > 1
+    assert not cache._RESPONSES
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_get_device_snapshot_success(monkeypatch):
+    """Test successful execution of the get_device_snapshot tool function.
+
+    Verifies that all requested getters are passed, without duplicates, to a
+    single runner call and reported in the result metadata.
+    """
+    mock_run_getters = MagicMock(return_value={"host1": {"facts": {}, "interfaces": {}}})
+    monkeypatch.setattr(NapalmRunner, "run_getters", mock_run_getters)
+
+    result = await get_device_snapshot(["facts", "interfaces", "facts"], host_name="host1")
+
+    assert "error" not in result
+    assert result["backend"] == "napalm"
+    assert result["data_type"] == ("facts", "interfaces")
+    assert result["target"] == "host1"
+    assert result["data"] == {"host1": {"facts": {}, "interfaces": {}}}
+    # Duplicate getters are dropped before dispatch
+    mock_run_getters.assert_called_once_with(("facts", "interfaces"), host_name="host1", group_name=None)
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_get_device_snapshot_accepts_json_string(monkeypatch):
+    """Test that get_device_snapshot accepts getters passed as a JSON array string."""
+    mock_run_getters = MagicMock(return_value={"host1": {}})
+    monkeypatch.setattr(NapalmRunner, "run_getters", mock_run_getters)
+
+    result = await get_device_snapshot('["facts", "interfaces"]', host_name="host1")
+
+    assert "error" not in result
+    mock_run_getters.assert_called_once_with(("facts", "interfaces"), host_name="host1", group_name=None)
+
+
+async def test_get_device_snapshot_invalid_json():
+    """Test that malformed getters JSON is reported as invalid parameters."""
+    result = await get_device_snapshot('["facts",', host_name="host1")
     assert result["error"] == "invalid_parameters"
 
 
-@pytest.mark.asyncio
-async def test_run_cli_commands_success():
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_get_device_data_truncates_error_message(monkeypatch):
+    """Test that oversized error messages are truncated in the tool response."""
+
+    def run_getter(self, getter, **kwargs):
+        raise RuntimeError("x" * 100_000)
+
+    monkeypatch.setattr(NapalmRunner, "run_getter", run_getter)
+
+    result = await get_device_data("facts")
+
+    assert result["error"] == "execution_error"
+    assert len(result["message"]) < MAX_ERROR_MESSAGE_LENGTH + len("... [truncated]") + 1
+    assert result["message"].endswith("[truncated]")
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_run_cli_commands_success(monkeypatch):
     """Test successful execution of the run_cli_commands tool function.
 
     Verifies that the tool function properly executes and returns
     the expected result structure when the operation succeeds.
     """
-    with (
-        patch("nornir_mcp.tools.get_nornir") as mock_get_nornir,
-        patch("nornir_mcp.tools.NetmikoRunner") as MockRunner,
-    ):
-        # Mock the get_nornir function to return a mock Nornir instance
-        mock_nornir_instance = mock_get_nornir.return_value
-
-        mock_instance = MockRunner.return_value
-        # Return a plain dict instead of a Success object
-        mock_instance.run_command.return_value = {"host1": "output"}
-
-        result = await run_cli_commands("show version")
-
-        assert "error" not in result
-        assert result["backend"] == "netmiko"
-        assert result["commands"] == "show version"
-        assert result["target"] == "all"
-        assert result["data"] == {"host1": "output"}
-        mock_instance.run_command.assert_called_once_with("show version", host_name=None, group_name=None)
-        MockRunner.assert_called_once_with(mock_nornir_instance)
-
-
-@pytest.mark.asyncio
-async def test_run_cli_commands_invalid_params():
-    """Test invalid parameters handling in the run_cli_commands tool function.
-
-    Verifies that the tool function properly validates parameters and returns
-    the expected error response when invalid parameters are provided.
+    mock_run_command = MagicMock(return_value={"host1": "output"})
+    monkeypatch.setattr(NetmikoRunner, "run_command", mock_run_command)
+
+    result = await run_cli_commands("show version")
+
+    assert "error" not in result
+    assert result["backend"] == "netmiko"
+    assert result["commands"] == "show version"
+    assert result["target"] == "all"
+    assert result["data"] == {"host1": "output"}
+    mock_run_command.assert_called_once_with("show version", host_name=None, group_name=None)
+
+
+@pytest.mark.usefixtures("mock_get_nornir")
+async def test_backend_semaphore_bounds_concurrency(monkeypatch):
+    """Test that no more calls than the backend limit run at the same time."""
+    limit, calls = 2, 5
+    monkeypatch.setitem(tools._BACKEND_SEMAPHORES, Backend.NETMIKO, asyncio.Semaphore(limit))
+    lock = threading.Lock()
+    running = peak = 0
+
+    def run_command(self, command, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return {"host1": "output"}
+
+    monkeypatch.setattr(NetmikoRunner, "run_command", run_command)
+
+    results = await asyncio.gather(*(run_cli_commands("show version") for _ in range(calls)))
+
+    assert all("error" not in result for result in results)
+    assert peak == limit
+
+
+@pytest.mark.parametrize(
+    ("tool", "args"),
+    [
+        pytest.param(get_device_data, ("facts",), id="get_device_data"),
+        pytest.param(get_device_snapshot, (["facts"],), id="get_device_snapshot"),
+        pytest.param(run_cli_commands, ("cmd",), id="run_cli_commands"),
+    ],
+)
+async def test_tools_reject_host_and_group(tool, args):
+    """Test invalid parameters handling in the tool functions.
+
+    Verifies that each tool validates its target parameters and returns
+    the expected error response when both a host and a group are given.
     """
-    result = await run_cli_commands("cmd", host_name="h1", group_name="g1")
+    result = await tool(*args, host_name="h1", group_name="g1")
     assert result["error"] == "invalid_parameters"
+
+
+async def test_list_nornir_inventory_cached_until_reload(mock_nornir, monkeypatch):
+    """Test that the inventory summary is memoized until the inventory is reloaded.
+
+    Verifies that repeated listings reuse the first summary and that a
+    reload, which replaces the Nornir instance, produces a fresh one.
+    """
+    reloaded_nornir = MagicMock()
+    reloaded_nornir.inventory = MagicMock(hosts={}, groups={})
+    mock_nornir.inventory.groups = {}
+
+    mock_get_nornir = MagicMock(return_value=mock_nornir)
+    monkeypatch.setattr("nornir_mcp.resources.get_nornir", mock_get_nornir)
+    # Reloading swaps in a new Nornir instance, as reset_nornir does
+    monkeypatch.setattr(
+        "nornir_mcp.tools.reset_nornir",
+        lambda: setattr(mock_get_nornir, "return_value", reloaded_nornir),
+    )
+
+    first = list_nornir_inventory()
+    assert first == {"hosts": {}, "groups": {}, "total_hosts": 0, "total_groups": 0}
+    assert list_nornir_inventory() is first
+
+    result = await reload_nornir_inventory()
+    assert result["status"] == "success"
+
+    assert list_nornir_inventory() is not first
+
+
+async def test_clear_cache_discards_inflight_results():
+    """Test that an execution started before a reload is neither joined nor cached."""
+    release = asyncio.Event()
+    results = iter([{"data": "stale"}, {"data": "fresh"}])
+
+    async def fetch():
+        response = next(results)
+        await release.wait()
+        return response
+
+    stale = asyncio.ensure_future(cache.coalesce("key", fetch))
+    await asyncio.sleep(0)
+    clear_cache()
+    fresh = asyncio.ensure_future(cache.coalesce("key", fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await stale == {"data": "stale"}
+    assert await fresh == {"data": "fresh"}
+    assert cache.cached_response("key") == {"data": "fresh"}
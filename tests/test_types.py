@@ -0,0 +1,30 @@
+"""Tests for the types module.
+
+This module contains unit tests for the MCP exception and error response
+helpers shared by the tools and runners.
+"""
+
+import pickle
+
+from nornir_mcp.constants import ErrorType
+from nornir_mcp.types import MCPException
+
+
+def test_mcp_exception_str():
+    """Test that the exception text combines the error type and message."""
+    error = MCPException(ErrorType.NO_HOSTS, "No hosts found for the given target.")
+
+    assert str(error) == "no_hosts: No hosts found for the given target."
+    assert error.args == (ErrorType.NO_HOSTS, "No hosts found for the given target.")
+
+
+def test_mcp_exception_pickle_round_trip():
+    """Test that an unpickled exception keeps its error type, message and text."""
+    error = MCPException(ErrorType.EXECUTION_ERROR, "Connection refused")
+
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert isinstance(restored, MCPException)
+    assert restored.error_type == error.error_type
+    assert restored.message == error.message
+    assert str(restored) == str(error)